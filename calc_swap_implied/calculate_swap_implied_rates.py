@@ -9,6 +9,10 @@ Supports: 1-month, 3-month, and 6-month tenors
 
 Requirements:
     pip install pandas openpyxl requests beautifulsoup4 --break-system-packages
+    pip install numba   # optional, JIT-compiled calculation for large inputs
+    pip install numexpr   # optional, multi-threaded calculation when numba is absent
+    pip install xlsxwriter python-calamine   # optional, faster Excel output/input
+    pip install polars fastexcel   # optional, --engine polars
 
 Usage:
     python calculate_swap_implied_rates.py input.xlsx output.xlsx --tenor 1M
@@ -25,40 +29,191 @@ Output Excel Format:
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from calendar import monthrange
+from functools import lru_cache
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
 import argparse
 import requests
 from bs4 import BeautifulSoup
 import re
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import numexpr  # noqa: F401
+    HAVE_NUMEXPR = True
+except ImportError:
+    HAVE_NUMEXPR = False
+
+# xlsxwriter streams XML and is several times faster than openpyxl for output
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_WRITER_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_WRITER_ENGINE = 'openpyxl'
+
+
+# Below this many rows the numpy expression is already fast and numba's
+# one-off JIT compilation would dominate the run time
+NUMBA_MIN_ROWS = 10_000
+
+# Same trade-off for numexpr's thread pool when numba is not installed
+NUMEXPR_MIN_ROWS = 10_000
+
+# Inputs this large are split across worker processes; below it process
+# start-up and pickling cost more than the vectorized pass itself
+PARALLEL_MIN_ROWS = 500_000
+
+_CIP_EXPRESSION = (
+    "((forward_rate / spot_rate) * (1 + usd_rate / 100 * days / 360) - 1)"
+    " * (365 / days) * 100"
+)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _implied_sgd_rate_kernel(spot_rate, forward_rate, usd_rate, days):
+        """Compiled, multi-threaded CIP loop (see calculate_implied_sgd_rate)"""
+        out = np.empty(spot_rate.size)
+        for i in prange(spot_rate.size):
+            usd_factor = 1.0 + (usd_rate[i] / 100.0) * (days[i] / 360.0)
+            sgd_factor = (forward_rate[i] / spot_rate[i]) * usd_factor
+            out[i] = (sgd_factor - 1.0) * (365.0 / days[i]) * 100.0
+        return out
+
+
+def implied_sgd_rate_batch(spot_rate, forward_rate, usd_rate, days):
+    """
+    Calculate implied SGD rates (%) for arrays of trades
+    
+    Uses the numba kernel for large inputs when numba is installed, then
+    pandas.eval with numexpr (fused, multi-threaded), otherwise the numpy
+    form of SwapImpliedRateCalculator.calculate_implied_sgd_rate.
+    
+    Args:
+        spot_rate: numpy array of spot FX rates
+        forward_rate: numpy array of forward FX rates
+        usd_rate: numpy array of USD interest rates in percent
+        days: numpy array of actual days between spot and forward
+        
+    Returns:
+        ndarray: implied SGD rates in percent
+    """
+    if njit is not None and spot_rate.size >= NUMBA_MIN_ROWS:
+        return _implied_sgd_rate_kernel(
+            np.ascontiguousarray(spot_rate, dtype=np.float64),
+            np.ascontiguousarray(forward_rate, dtype=np.float64),
+            np.ascontiguousarray(usd_rate, dtype=np.float64),
+            np.ascontiguousarray(days, dtype=np.float64),
+        )
+    if HAVE_NUMEXPR and spot_rate.size >= NUMEXPR_MIN_ROWS:
+        return pd.eval(_CIP_EXPRESSION, engine='numexpr', local_dict={
+            'spot_rate': spot_rate,
+            'forward_rate': forward_rate,
+            'usd_rate': usd_rate,
+            'days': days,
+        })
+    return SwapImpliedRateCalculator.calculate_implied_sgd_rate(
+        spot_rate, forward_rate, usd_rate, days
+    )
+
+
+# Standard US banking holidays for 2026
+US_HOLIDAYS_2026 = frozenset({
+    datetime(2026, 1, 1),   # New Year's Day
+    datetime(2026, 1, 19),  # MLK Day
+    datetime(2026, 2, 16),  # Presidents Day
+    datetime(2026, 4, 3),   # Good Friday
+    datetime(2026, 5, 25),  # Memorial Day
+    datetime(2026, 7, 3),   # Independence Day (observed)
+    datetime(2026, 9, 7),   # Labor Day
+    datetime(2026, 10, 12), # Columbus Day
+    datetime(2026, 11, 11), # Veterans Day
+    datetime(2026, 11, 26), # Thanksgiving
+    datetime(2026, 12, 25), # Christmas
+})
+
+# Official Singapore public holidays for 2026 from MOM
+SG_HOLIDAYS_2026 = frozenset({
+    datetime(2026, 1, 1),   # New Year's Day
+    datetime(2026, 2, 17),  # Chinese New Year
+    datetime(2026, 2, 18),  # Chinese New Year
+    # Mar 21 (Sat) Hari Raya Puasa - falls on Saturday, no substitute
+    datetime(2026, 4, 3),   # Good Friday
+    datetime(2026, 5, 1),   # Labour Day
+    datetime(2026, 5, 27),  # Hari Raya Haji
+    # May 31 (Sun) Vesak Day - observed on Monday
+    datetime(2026, 6, 1),   # Vesak Day observed
+    # Aug 9 (Sun) National Day - observed on Monday
+    datetime(2026, 8, 10),  # National Day observed
+    # Nov 8 (Sun) Deepavali - observed on Monday
+    datetime(2026, 11, 9),  # Deepavali observed
+    datetime(2026, 12, 25), # Christmas Day
+})
+
+
+@lru_cache(maxsize=8192)
+def _is_business_ordinal(ordinal, us_holidays, sg_holidays):
+    """Business day check for a date ordinal, memoized across calls"""
+    date = datetime.fromordinal(ordinal)
+    
+    # Weekend check
+    if date.weekday() >= 5:  # Saturday = 5, Sunday = 6
+        return False
+    
+    # Holiday check - must be working day in BOTH markets
+    return date not in us_holidays and date not in sg_holidays
+
 
 class HolidayCalendar:
     """Manages US and Singapore holiday calendars with automatic fetching"""
     
+    # Number of days covered by the precomputed business day bitmap
+    BITMAP_DAYS = 4000
+    
     def __init__(self, year=2026):
         self.year = year
         self.us_holidays = self._get_us_holidays()
         self.sg_holidays = self._get_sg_holidays()
+        self._build_bitmap()
+        
+        # Mon-Fri weekmask plus holidays in either market, for numpy's
+        # vectorized business day functions
+        self.busdaycal = np.busdaycalendar(
+            weekmask='1111100',
+            holidays=np.array(sorted(self.us_holidays | self.sg_holidays), dtype='datetime64[D]')
+        )
+    
+    def _build_bitmap(self):
+        """
+        Precompute a non-business day bitmap indexed by day offset
+        
+        Covers BITMAP_DAYS days from Jan 1 of the previous year, marking
+        weekends and holidays in either market, so is_business_day becomes
+        a single array lookup.
+        """
+        self._bitmap_start = datetime(self.year - 1, 1, 1).toordinal()
+        ordinals = np.arange(self.BITMAP_DAYS) + self._bitmap_start
+        
+        # date.weekday() == (ordinal + 6) % 7; Saturday = 5, Sunday = 6
+        self._non_business = (ordinals + 6) % 7 >= 5
+        
+        for holiday in self.us_holidays | self.sg_holidays:
+            offset = holiday.toordinal() - self._bitmap_start
+            if 0 <= offset < self.BITMAP_DAYS:
+                self._non_business[offset] = True
     
     def _get_us_holidays(self):
         """
         Get US banking holidays for the year
         Source: NY SIFMA recommended calendar
         """
-        # Standard US banking holidays for 2026
-        holidays = [
-            datetime(2026, 1, 1),   # New Year's Day
-            datetime(2026, 1, 19),  # MLK Day
-            datetime(2026, 2, 16),  # Presidents Day
-            datetime(2026, 4, 3),   # Good Friday
-            datetime(2026, 5, 25),  # Memorial Day
-            datetime(2026, 7, 3),   # Independence Day (observed)
-            datetime(2026, 9, 7),   # Labor Day
-            datetime(2026, 10, 12), # Columbus Day
-            datetime(2026, 11, 11), # Veterans Day
-            datetime(2026, 11, 26), # Thanksgiving
-            datetime(2026, 12, 25), # Christmas
-        ]
+        holidays = US_HOLIDAYS_2026
         
         print(f"Loaded {len(holidays)} US banking holidays for {self.year}")
         return holidays
@@ -69,23 +224,7 @@ class HolidayCalendar:
         Source: Ministry of Manpower (MOM) official calendar
         URL: https://www.mom.gov.sg/employment-practices/public-holidays
         """
-        # Official Singapore public holidays for 2026 from MOM
-        holidays = [
-            datetime(2026, 1, 1),   # New Year's Day
-            datetime(2026, 2, 17),  # Chinese New Year
-            datetime(2026, 2, 18),  # Chinese New Year
-            # Mar 21 (Sat) Hari Raya Puasa - falls on Saturday, no substitute
-            datetime(2026, 4, 3),   # Good Friday
-            datetime(2026, 5, 1),   # Labour Day
-            datetime(2026, 5, 27),  # Hari Raya Haji
-            # May 31 (Sun) Vesak Day - observed on Monday
-            datetime(2026, 6, 1),   # Vesak Day observed
-            # Aug 9 (Sun) National Day - observed on Monday
-            datetime(2026, 8, 10),  # National Day observed
-            # Nov 8 (Sun) Deepavali - observed on Monday
-            datetime(2026, 11, 9),  # Deepavali observed
-            datetime(2026, 12, 25), # Christmas Day
-        ]
+        holidays = SG_HOLIDAYS_2026
         
         print(f"Loaded {len(holidays)} Singapore public holidays for {self.year}")
         return holidays
@@ -100,15 +239,13 @@ class HolidayCalendar:
         Returns:
             bool: True if business day in both markets
         """
-        # Weekend check
-        if date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
+        ordinal = date.toordinal()
+        offset = ordinal - self._bitmap_start
+        if 0 <= offset < self.BITMAP_DAYS:
+            return not self._non_business[offset]
         
-        # Holiday check - must be working day in BOTH markets
-        if date in self.us_holidays or date in self.sg_holidays:
-            return False
-        
-        return True
+        # Outside the bitmap range - fall back to (cached) direct checks
+        return _is_business_ordinal(ordinal, self.us_holidays, self.sg_holidays)
     
     def add_business_days(self, start_date, num_days, verbose=False):
         """
@@ -147,6 +284,70 @@ class HolidayCalendar:
                 print(f"    Skip: {current.strftime('%Y-%m-%d %A')} {reason}")
         
         return current
+    
+    def add_business_days_bulk(self, start_dates, num_days):
+        """
+        Vectorized add_business_days over an array of dates
+        
+        Non-business start dates are first rolled back to the previous
+        business day, which matches counting business days strictly after
+        the start date as add_business_days does.
+        
+        Args:
+            start_dates: numpy datetime64[D] array
+            num_days: number of business days to add
+            
+        Returns:
+            ndarray: datetime64[D] array of resulting dates
+        """
+        return np.busday_offset(start_dates, num_days, roll='backward',
+                                busdaycal=self.busdaycal)
+
+
+@lru_cache(maxsize=None)
+def get_holiday_calendar(year=2026):
+    """
+    Get a shared HolidayCalendar for the year
+    
+    Calendars are immutable once built, so repeated calls (e.g. one per
+    tenor or per input file) reuse the same instance.
+    """
+    return HolidayCalendar(year=year)
+
+
+def _roll_forward_dates(spot_dates, months, busdaycal):
+    """
+    Same day N months later, clamped to the month end and rolled to the
+    following business day, for a datetime64[D] array of spot dates
+    """
+    spot_month = spot_dates.astype('datetime64[M]')
+    day_of_month = (spot_dates - spot_month.astype('datetime64[D]')).astype(np.int64)
+    
+    # Clamp day to month end (e.g., Jan 31 -> Feb 28)
+    target_month = spot_month + months
+    target_start = target_month.astype('datetime64[D]')
+    month_length = ((target_month + 1).astype('datetime64[D]') - target_start).astype(np.int64)
+    tentative = target_start + np.minimum(day_of_month, month_length - 1)
+    
+    # Following business day convention
+    return np.busday_offset(tentative, 0, roll='following', busdaycal=busdaycal)
+
+
+@lru_cache(maxsize=None)
+def _forward_date_table(calendar, months):
+    """
+    Forward dates for every spot date in a calendar's bitmap range
+    
+    The tenor is fixed per calculator, so the month arithmetic and business
+    day roll are evaluated once per (calendar, tenor) and bulk forward date
+    resolution becomes an array lookup.
+    
+    Returns:
+        tuple: (first spot date as datetime64[D], datetime64[D] table)
+    """
+    start = np.datetime64(datetime.fromordinal(calendar._bitmap_start), 'D')
+    spot_dates = start + np.arange(calendar.BITMAP_DAYS)
+    return start, _roll_forward_dates(spot_dates, months, calendar.busdaycal)
 
 
 class SwapImpliedRateCalculator:
@@ -194,22 +395,13 @@ class SwapImpliedRateCalculator:
             datetime: forward value date
         """
         # Add specified months (same day N months later)
-        year = spot_date.year
-        month = spot_date.month + self.months
-        day = spot_date.day
-        
-        # Handle month overflow
-        while month > 12:
-            month -= 12
-            year += 1
-        
-        # Handle day overflow (e.g., Jan 31 -> Feb 28)
-        while True:
-            try:
-                tentative = datetime(year, month, day)
-                break
-            except ValueError:
-                day -= 1
+        year_offset, month_index = divmod(spot_date.month - 1 + self.months, 12)
+        year = spot_date.year + year_offset
+        month = month_index + 1
+        
+        # Clamp day to month end (e.g., Jan 31 -> Feb 28)
+        day = min(spot_date.day, monthrange(year, month)[1])
+        tentative = datetime(year, month, day)
         
         # Adjust to business day using following business day convention
         while not self.calendar.is_business_day(tentative):
@@ -217,17 +409,50 @@ class SwapImpliedRateCalculator:
         
         return tentative
     
+    def calculate_spot_dates(self, trade_dates):
+        """
+        Calculate spot dates (T+2 business days) for an array of trade dates
+        
+        Args:
+            trade_dates: numpy datetime64[D] array
+            
+        Returns:
+            ndarray: datetime64[D] array of spot value dates
+        """
+        return self.calendar.add_business_days_bulk(trade_dates, 2)
+    
+    def calculate_forward_dates(self, spot_dates):
+        """
+        Calculate forward dates for an array of spot dates
+        Same convention as calculate_forward_date; spot dates inside the
+        calendar's bitmap range are looked up in a table precomputed once
+        per tenor, others are evaluated with numpy month arithmetic
+        
+        Args:
+            spot_dates: numpy datetime64[D] array
+            
+        Returns:
+            ndarray: datetime64[D] array of forward value dates
+        """
+        # Tenor-specific lookup table over the calendar's bitmap range
+        table_start, table = _forward_date_table(self.calendar, self.months)
+        offsets = (spot_dates - table_start).astype(np.int64)
+        if offsets.size and offsets.min() >= 0 and offsets.max() < table.size:
+            return table[offsets]
+        
+        return _roll_forward_dates(spot_dates, self.months, self.calendar.busdaycal)
+    
     @staticmethod
     def calculate_forward_rate(spot_rate, forward_points_pips):
         """
         Calculate forward FX rate from spot and forward points
         
         Args:
-            spot_rate: spot FX rate (SGD per USD)
+            spot_rate: spot FX rate (SGD per USD), scalar or numpy array
             forward_points_pips: forward points in pips (1 pip = 0.0001)
             
         Returns:
-            float: forward FX rate
+            float or ndarray: forward FX rate
         """
         return spot_rate + (forward_points_pips / 10000)
     
@@ -242,6 +467,8 @@ class SwapImpliedRateCalculator:
         Solving for r_SGD:
             r_SGD = [(F/S) × (1 + r_USD × days/360) - 1] × (365/days)
         
+        Works element-wise on numpy arrays as well as on scalars.
+        
         Args:
             spot_rate: spot FX rate (SGD per USD)
             forward_rate: forward FX rate (SGD per USD)
@@ -249,7 +476,7 @@ class SwapImpliedRateCalculator:
             days: actual days between spot and forward
             
         Returns:
-            float: implied SGD rate in percent
+            float or ndarray: implied SGD rate in percent
         """
         # Calculate F/S ratio
         fs_ratio = forward_rate / spot_rate
@@ -298,16 +525,18 @@ class SwapImpliedRateCalculator:
         rate_diff_bps = (implied_sgd_rate - sofr_rate) * 100
         
         if verbose:
-            print(f"\nCalculation for Trade Date: {trade_date.strftime('%Y-%m-%d')} [{self.tenor}]")
-            print(f"  Spot Date:        {spot_date.strftime('%Y-%m-%d (%A)')}")
-            print(f"  Forward Date:     {forward_date.strftime('%Y-%m-%d (%A)')}")
-            print(f"  Actual Days:      {actual_days}")
-            print(f"  Spot Rate:        {spot_rate:.4f}")
-            print(f"  Forward Points:   {forward_points:.2f} pips")
-            print(f"  Forward Rate:     {forward_rate:.4f}")
-            print(f"  USD SOFR {self.tenor}:    {sofr_rate:.5f}%")
-            print(f"  Implied SGD {self.tenor}:  {implied_sgd_rate:.4f}%")
-            print(f"  Differential:     {rate_diff_bps:.1f} bps")
+            print("\n".join([
+                f"\nCalculation for Trade Date: {trade_date.strftime('%Y-%m-%d')} [{self.tenor}]",
+                f"  Spot Date:        {spot_date.strftime('%Y-%m-%d (%A)')}",
+                f"  Forward Date:     {forward_date.strftime('%Y-%m-%d (%A)')}",
+                f"  Actual Days:      {actual_days}",
+                f"  Spot Rate:        {spot_rate:.4f}",
+                f"  Forward Points:   {forward_points:.2f} pips",
+                f"  Forward Rate:     {forward_rate:.4f}",
+                f"  USD SOFR {self.tenor}:    {sofr_rate:.5f}%",
+                f"  Implied SGD {self.tenor}:  {implied_sgd_rate:.4f}%",
+                f"  Differential:     {rate_diff_bps:.1f} bps",
+            ]))
         
         return {
             'Spot_Date': spot_date,
@@ -317,6 +546,120 @@ class SwapImpliedRateCalculator:
             'Implied_SGD_Rate_Pct': implied_sgd_rate,
             'Rate_Diff_bps': rate_diff_bps
         }
+    
+    def process_batch(self, trade_dates, sofr_rates, spot_rates, forward_points):
+        """
+        Calculate implied SGD rates for many trades at once
+        
+        Value dates and the CIP arithmetic are evaluated as numpy array
+        expressions over all trades in a single pass.
+        
+        Args:
+            trade_dates: numpy datetime64 array of trade dates
+            sofr_rates: numpy array of Term SOFR rates for the tenor (%)
+            spot_rates: numpy array of USD/SGD spot FX rates
+            forward_points: numpy array of forward points in pips
+            
+        Returns:
+            dict: column name -> numpy array of calculated values
+        """
+        spot_dates = self.calculate_spot_dates(trade_dates)
+        forward_dates = self.calculate_forward_dates(spot_dates)
+        
+        actual_days = (forward_dates - spot_dates).astype(np.int64)
+        forward_rate = self.calculate_forward_rate(spot_rates, forward_points)
+        implied_sgd_rate = implied_sgd_rate_batch(
+            spot_rates, forward_rate, sofr_rates, actual_days
+        )
+        rate_diff_bps = (implied_sgd_rate - sofr_rates) * 100
+        
+        # Explicit dtypes so pandas wraps the arrays without inference.
+        # Day counts fit comfortably in int16; rates stay float64 so the
+        # values written to Excel are not perturbed by float32 rounding.
+        return {
+            'Spot_Date': spot_dates.astype('datetime64[ns]'),
+            'Forward_Date': forward_dates.astype('datetime64[ns]'),
+            'Actual_Days': actual_days.astype(np.int16),
+            'Forward_Rate': np.asarray(forward_rate, dtype=np.float64),
+            'Implied_SGD_Rate_Pct': np.asarray(implied_sgd_rate, dtype=np.float64),
+            'Rate_Diff_bps': np.asarray(rate_diff_bps, dtype=np.float64)
+        }
+
+
+def _process_chunk(year, tenor, trade_dates, sofr_rates, spot_rates, forward_points):
+    """Worker for process_batch_parallel: one contiguous chunk of trades"""
+    calculator = SwapImpliedRateCalculator(get_holiday_calendar(year), tenor=tenor)
+    return calculator.process_batch(trade_dates, sofr_rates, spot_rates, forward_points)
+
+
+def process_batch_parallel(year, tenor, trade_dates, sofr_rates, spot_rates, forward_points,
+                           workers=None):
+    """
+    SwapImpliedRateCalculator.process_batch split across worker processes
+    
+    The inputs are cut into one contiguous chunk per worker; each worker
+    builds its own calendar for the year, so nothing but the arrays is
+    pickled.
+    
+    Args:
+        year: calendar year passed to get_holiday_calendar
+        tenor: '1M', '3M', or '6M'
+        trade_dates, sofr_rates, spot_rates, forward_points: numpy arrays
+        workers: number of processes (default: os.cpu_count())
+        
+    Returns:
+        dict: column name -> numpy array, as from process_batch
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [np.array_split(values, workers)
+              for values in (trade_dates, sofr_rates, spot_rates, forward_points)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_process_chunk, repeat(year), repeat(tenor), *chunks))
+    
+    return {col: np.concatenate([part[col] for part in parts]) for col in parts[0]}
+
+
+def read_excel_input(input_file, engine='pandas'):
+    """
+    Read an input workbook, preferring the Rust-backed calamine engine
+    
+    With engine='pandas', falls back to the default openpyxl reader when
+    python-calamine is not installed (or pandas is too old to know the
+    engine). With engine='polars', the workbook is parsed by polars
+    (fastexcel/calamine) and its columns handed to pandas as numpy arrays.
+    
+    Args:
+        input_file: path to Excel file
+        engine: 'pandas' or 'polars'
+        
+    Returns:
+        pandas DataFrame
+    """
+    if engine == 'polars':
+        import polars as pl
+        frame = pl.read_excel(input_file)
+        return pd.DataFrame({col: frame[col].to_numpy() for col in frame.columns})
+    
+    try:
+        return pd.read_excel(input_file, engine='calamine')
+    except (ImportError, ValueError):
+        return pd.read_excel(input_file)
+
+
+# Tenor-specific SOFR column, e.g. 1mSOFR, 3M_SOFR, "6M SOFR", SOFR_6M
+_SOFR_COLUMN_RE = re.compile(r'(?<!\d)([136])\s*M[\s_]*SOFR|SOFR[\s_]*([136])\s*M', re.IGNORECASE)
+
+# Any tenor mentioned in a column name, e.g. "3M" or "3 M"
+_TENOR_RE = re.compile(r'(?<!\d)([136])\s?M', re.IGNORECASE)
+
+
+def _sofr_column_tenor(col):
+    """Return the tenor ('1M', '3M', '6M') of a SOFR column name, or None"""
+    match = _SOFR_COLUMN_RE.search(str(col))
+    if match:
+        return (match.group(1) or match.group(2)) + 'M'
+    return None
 
 
 def detect_tenor_from_columns(df):
@@ -329,14 +672,16 @@ def detect_tenor_from_columns(df):
     Returns:
         str: detected tenor ('1M', '3M', or '6M') or None
     """
-    columns_str = ' '.join(df.columns).upper()
+    for col in df.columns:
+        tenor = _sofr_column_tenor(col)
+        if tenor:
+            return tenor
     
-    if '6M' in columns_str or '6 M' in columns_str:
-        return '6M'
-    elif '3M' in columns_str or '3 M' in columns_str:
-        return '3M'
-    elif '1M' in columns_str or '1 M' in columns_str:
-        return '1M'
+    # No SOFR column with a tenor - look for any tenor in the column names
+    found = {months + 'M' for months in _TENOR_RE.findall(' '.join(map(str, df.columns)))}
+    for tenor in ('6M', '3M', '1M'):
+        if tenor in found:
+            return tenor
     
     return None
 
@@ -352,27 +697,133 @@ def find_sofr_column(df, tenor):
     Returns:
         str: column name or None
     """
-    # Try various naming conventions
-    possible_names = [
-        f'{tenor}SOFR',
-        f'{tenor.lower()}SOFR',
-        f'{tenor}_SOFR',
-        f'SOFR_{tenor}',
-        f'{tenor[0]}mSOFR',  # e.g., 1mSOFR
-        f'{tenor[0]}MSOFR',
-        f'SOFR',  # Generic fallback
-    ]
+    tenor = tenor.upper()
+    fallback = None
     
     for col in df.columns:
-        col_upper = col.upper().replace(' ', '')
-        for name in possible_names:
-            if name.upper().replace(' ', '') in col_upper:
-                return col
+        if _sofr_column_tenor(col) == tenor:
+            return col
+        # Generic fallback: first column mentioning SOFR at all
+        if fallback is None and 'SOFR' in str(col).upper():
+            fallback = col
     
-    return None
+    return fallback
+
 
+# Methodology sheet text, filled in per tenor by methodology_text()
+_METHODOLOGY_TEMPLATE = """
+USD/SGD FX SWAP IMPLIED RATE CALCULATION METHODOLOGY
+TENOR: {tenor} ({months} months)
 
-def process_excel_file(input_file, output_file, tenor=None, verbose=True):
+1. BUSINESS DAY CALCULATION (T+2)
+   - Both US and Singapore markets must be open
+   - US holidays: NY SIFMA banking calendar
+   - Singapore holidays: MOM official public holidays
+   - Spot Date = Trade Date + 2 business days
+
+2. FORWARD DATE CALCULATION ({tenor})
+   - Convention: Same day {months} month(s) later, adjusted to business day
+   - Following business day convention if falls on holiday/weekend
+   - Handles month-end adjustments (e.g., Jan 31 → Feb 28)
+
+3. DAY COUNT CONVENTIONS
+   - USD (SOFR): ACT/360 (Actual days / 360)
+   - SGD: ACT/365 (Actual days / 365)
+
+4. COVERED INTEREST PARITY (CIP) FORMULA
+   
+   F = S × (1 + r_SGD × days/365) / (1 + r_USD × days/360)
+   
+   Solving for implied SGD rate:
+   r_SGD = [(F/S) × (1 + r_USD × days/360) - 1] × (365/days)
+   
+   Where:
+   - F = Forward FX rate (SGD per USD)
+   - S = Spot FX rate (SGD per USD)
+   - r_SGD = Singapore Dollar interest rate (solving for)
+   - r_USD = US Dollar interest rate ({tenor} Term SOFR)
+   - days = Actual calendar days between spot and forward
+
+5. FORWARD RATE CALCULATION
+   Forward Rate = Spot Rate + (Forward Points / 10,000)
+   Note: 1 pip = 0.0001
+
+6. TENOR-SPECIFIC PARAMETERS
+   - 1M: ~28-31 days (spot + 1 month)
+   - 3M: ~89-92 days (spot + 3 months)
+   - 6M: ~181-184 days (spot + 6 months)
+   
+   Actual days vary based on:
+   - Calendar month lengths
+   - Business day adjustments
+   - Holiday patterns
+
+7. DATA SOURCES
+   - US Holidays: NY SIFMA
+   - Singapore Holidays: Ministry of Manpower (MOM)
+   - URL: https://www.mom.gov.sg/employment-practices/public-holidays
+   - Term SOFR: CME Group
+
+8. RATE DIFFERENTIAL
+   Differential (bps) = (Implied SGD Rate - USD SOFR Rate) × 100
+   Negative differential indicates SGD rates are lower than USD rates
+
+9. ECONOMIC INTERPRETATION
+   - Negative forward points → SGD appreciation expected
+   - Lower SGD rates → Reflects MAS exchange rate policy
+   - Rate differential → Carry trade opportunity
+   - Longer tenors → Larger accumulated differential
+        """
+
+
+@lru_cache(maxsize=None)
+def methodology_text(tenor):
+    """Methodology sheet text for a tenor (formatted once per tenor)"""
+    return _METHODOLOGY_TEMPLATE.format(
+        tenor=tenor, months=SwapImpliedRateCalculator.TENOR_MONTHS[tenor]
+    )
+
+
+def write_methodology_sheet(writer, tenor):
+    """
+    Add the Methodology sheet to an open pd.ExcelWriter
+    
+    Writes the header and text cells directly through the underlying
+    xlsxwriter or openpyxl workbook. When appending to an existing
+    workbook whose Methodology sheet already holds the same text, the
+    sheet is left as it is.
+    
+    Args:
+        writer: pd.ExcelWriter
+        tenor: '1M', '3M', or '6M'
+        
+    Returns:
+        bool: True if the sheet was (re)written
+    """
+    text = methodology_text(tenor)
+    if writer.engine == 'xlsxwriter':
+        sheet = writer.book.add_worksheet('Methodology')
+        sheet.write(0, 0, 'Methodology')
+        sheet.write(1, 0, text)
+        return True
+    
+    book = writer.book
+    index = None
+    if 'Methodology' in book.sheetnames:
+        existing = book['Methodology']
+        if existing['A2'].value == text:
+            return False
+        index = book.sheetnames.index('Methodology')
+        book.remove(existing)
+    
+    sheet = book.create_sheet('Methodology', index)
+    sheet['A1'] = 'Methodology'
+    sheet['A2'] = text
+    return True
+
+
+def process_excel_file(input_file, output_file, tenor=None, verbose=False, engine='pandas',
+                       append=False):
     """
     Process Excel file with FX swap data and calculate implied rates
     
@@ -380,7 +831,14 @@ def process_excel_file(input_file, output_file, tenor=None, verbose=True):
         input_file: path to input Excel file
         output_file: path to output Excel file
         tenor: tenor to use ('1M', '3M', '6M'). If None, will try to auto-detect
-        verbose: print progress information
+        verbose: print per-trade calculation details
+        engine: DataFrame library used to read the input ('pandas' or 'polars')
+        append: update an existing output workbook in place, replacing the
+            Results and Summary sheets and keeping an unchanged Methodology
+            sheet
+    
+    Returns:
+        DataFrame of the results written to the Results sheet
     """
     print("=" * 80)
     print("USD/SGD FX SWAP IMPLIED RATE CALCULATOR - MULTI-TENOR")
@@ -389,7 +847,7 @@ def process_excel_file(input_file, output_file, tenor=None, verbose=True):
     
     # Read input file
     print(f"Reading input file: {input_file}")
-    df = pd.read_excel(input_file)
+    df = read_excel_input(input_file, engine=engine)
     print(f"  Loaded {len(df)} rows")
     print(f"  Columns: {df.columns.tolist()}")
     print()
@@ -447,35 +905,46 @@ def process_excel_file(input_file, output_file, tenor=None, verbose=True):
     print(f"Using Forward Points column: '{fwd_pts_col}'")
     print()
     
+    # Parse the trade dates once; everything below works off this array
+    trade_dates = pd.to_datetime(df['Date']).to_numpy(dtype='datetime64[D]')
+    
     # Initialize calculators
-    first_year = pd.to_datetime(df['Date'].iloc[0]).year
+    first_year = int(trade_dates[0].astype('datetime64[Y]').astype(np.int64)) + 1970
     print(f"Initializing holiday calendars for year {first_year}...")
-    calendar = HolidayCalendar(year=first_year)
+    calendar = get_holiday_calendar(year=first_year)
     calculator = SwapImpliedRateCalculator(calendar, tenor=tenor)
     print()
     
-    # Process each row
+    # Process all rows in one vectorized pass
     print(f"Processing {len(df)} trades for {tenor} tenor...")
-    print("-" * 80)
-    
-    results = []
-    for idx, row in df.iterrows():
-        trade_date = pd.to_datetime(row['Date'])
-        
-        result = calculator.process_row(
-            trade_date=trade_date,
-            sofr_rate=row[sofr_col],
-            spot_rate=row[fx_col],
-            forward_points=row[fwd_pts_col],
-            verbose=verbose
-        )
-        
-        results.append(result)
+    
+    sofr_rates = df[sofr_col].to_numpy(dtype=np.float64)
+    spot_rates = df[fx_col].to_numpy(dtype=np.float64)
+    forward_points = df[fwd_pts_col].to_numpy(dtype=np.float64)
+    
+    if len(df) >= PARALLEL_MIN_ROWS and (os.cpu_count() or 1) > 1:
+        print(f"  Splitting across {os.cpu_count()} worker processes")
+        results = process_batch_parallel(first_year, tenor, trade_dates,
+                                         sofr_rates, spot_rates, forward_points)
+    else:
+        results = calculator.process_batch(trade_dates, sofr_rates, spot_rates, forward_points)
+    
+    # Per-row calculation details (debug output only)
+    if verbose:
         print("-" * 80)
+        for i, trade_date in enumerate(pd.DatetimeIndex(trade_dates).to_pydatetime()):
+            calculator.process_row(
+                trade_date=trade_date,
+                sofr_rate=sofr_rates[i],
+                spot_rate=spot_rates[i],
+                forward_points=forward_points[i],
+                verbose=True
+            )
+            print("-" * 80)
     
-    # Create output dataframe
-    results_df = pd.DataFrame(results)
-    output_df = pd.concat([df, results_df], axis=1)
+    # Add calculated columns to the input frame
+    for col, values in results.items():
+        df[col] = values
     
     # Reorder columns for better readability
     output_cols = [
@@ -490,7 +959,6 @@ def process_excel_file(input_file, output_file, tenor=None, verbose=True):
         'Implied_SGD_Rate_Pct',
         'Rate_Diff_bps'
     ]
-    output_df = output_df[output_cols]
     
     # Rename columns for clarity
     rename_dict = {
@@ -499,13 +967,19 @@ def process_excel_file(input_file, output_file, tenor=None, verbose=True):
         fx_col: 'Spot_Rate',
         fwd_pts_col: 'Forward_Points_pips'
     }
-    output_df = output_df.rename(columns=rename_dict)
+    output_df = df[output_cols].rename(columns=rename_dict)
     
     # Save to Excel
     print()
     print(f"Saving results to: {output_file}")
     
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+    if append and os.path.exists(output_file):
+        # Only openpyxl can modify an existing workbook
+        writer_args = {'engine': 'openpyxl', 'mode': 'a', 'if_sheet_exists': 'replace'}
+    else:
+        writer_args = {'engine': EXCEL_WRITER_ENGINE}
+    
+    with pd.ExcelWriter(output_file, **writer_args) as writer:
         # Write main results
         output_df.to_excel(writer, sheet_name='Results', index=False)
         
@@ -539,79 +1013,16 @@ def process_excel_file(input_file, output_file, tenor=None, verbose=True):
         summary_df = pd.DataFrame(summary_data)
         summary_df.to_excel(writer, sheet_name='Summary', index=False)
         
-        # Write methodology
-        methodology_text = f"""
-USD/SGD FX SWAP IMPLIED RATE CALCULATION METHODOLOGY
-TENOR: {tenor} ({SwapImpliedRateCalculator.TENOR_MONTHS[tenor]} months)
-
-1. BUSINESS DAY CALCULATION (T+2)
-   - Both US and Singapore markets must be open
-   - US holidays: NY SIFMA banking calendar
-   - Singapore holidays: MOM official public holidays
-   - Spot Date = Trade Date + 2 business days
-
-2. FORWARD DATE CALCULATION ({tenor})
-   - Convention: Same day {SwapImpliedRateCalculator.TENOR_MONTHS[tenor]} month(s) later, adjusted to business day
-   - Following business day convention if falls on holiday/weekend
-   - Handles month-end adjustments (e.g., Jan 31 → Feb 28)
-
-3. DAY COUNT CONVENTIONS
-   - USD (SOFR): ACT/360 (Actual days / 360)
-   - SGD: ACT/365 (Actual days / 365)
-
-4. COVERED INTEREST PARITY (CIP) FORMULA
-   
-   F = S × (1 + r_SGD × days/365) / (1 + r_USD × days/360)
-   
-   Solving for implied SGD rate:
-   r_SGD = [(F/S) × (1 + r_USD × days/360) - 1] × (365/days)
-   
-   Where:
-   - F = Forward FX rate (SGD per USD)
-   - S = Spot FX rate (SGD per USD)
-   - r_SGD = Singapore Dollar interest rate (solving for)
-   - r_USD = US Dollar interest rate ({tenor} Term SOFR)
-   - days = Actual calendar days between spot and forward
-
-5. FORWARD RATE CALCULATION
-   Forward Rate = Spot Rate + (Forward Points / 10,000)
-   Note: 1 pip = 0.0001
-
-6. TENOR-SPECIFIC PARAMETERS
-   - 1M: ~28-31 days (spot + 1 month)
-   - 3M: ~89-92 days (spot + 3 months)
-   - 6M: ~181-184 days (spot + 6 months)
-   
-   Actual days vary based on:
-   - Calendar month lengths
-   - Business day adjustments
-   - Holiday patterns
-
-7. DATA SOURCES
-   - US Holidays: NY SIFMA
-   - Singapore Holidays: Ministry of Manpower (MOM)
-   - URL: https://www.mom.gov.sg/employment-practices/public-holidays
-   - Term SOFR: CME Group
-
-8. RATE DIFFERENTIAL
-   Differential (bps) = (Implied SGD Rate - USD SOFR Rate) × 100
-   Negative differential indicates SGD rates are lower than USD rates
-
-9. ECONOMIC INTERPRETATION
-   - Negative forward points → SGD appreciation expected
-   - Lower SGD rates → Reflects MAS exchange rate policy
-   - Rate differential → Carry trade opportunity
-   - Longer tenors → Larger accumulated differential
-        """
-        
-        methodology_df = pd.DataFrame({
-            'Methodology': [methodology_text]
-        })
-        methodology_df.to_excel(writer, sheet_name='Methodology', index=False)
+        # Write methodology straight into the sheet: a single text cell
+        # does not need a DataFrame round trip
+        methodology_written = write_methodology_sheet(writer, tenor)
     
     print(f"  Results sheet: calculated implied rates for {tenor}")
     print(f"  Summary sheet: statistics")
-    print(f"  Methodology sheet: calculation details")
+    if methodology_written:
+        print(f"  Methodology sheet: calculation details")
+    else:
+        print(f"  Methodology sheet: unchanged, kept existing sheet")
     print()
     
     # Print summary
@@ -629,6 +1040,8 @@ TENOR: {tenor} ({SwapImpliedRateCalculator.TENOR_MONTHS[tenor]} months)
     print("=" * 80)
     print("CALCULATION COMPLETE")
     print("=" * 80)
+    
+    return output_df
 
 
 def main():
@@ -639,6 +1052,7 @@ def main():
         epilog="""
 Examples:
   python calculate_swap_implied_rates.py input.xlsx output.xlsx --tenor 1M
+  python calculate_swap_implied_rates.py input.xlsx output.xlsx --tenor 1M --verbose
   python calculate_swap_implied_rates.py input.xlsx output.xlsx --tenor 3M
   python calculate_swap_implied_rates.py input.xlsx output.xlsx --tenor 6M
   python calculate_swap_implied_rates.py input.xlsx output.xlsx  (auto-detect tenor)
@@ -661,8 +1075,14 @@ Input File Requirements:
                         help='Output Excel file path (default: swap_implied_rates_output.xlsx)')
     parser.add_argument('--tenor', '-t', choices=['1M', '3M', '6M', '1m', '3m', '6m'],
                         help='Tenor to calculate (1M, 3M, or 6M). If not specified, will auto-detect from column names')
+    parser.add_argument('--engine', choices=['pandas', 'polars'], default='pandas',
+                        help='Library used to read the input file (default: pandas; polars needs polars + fastexcel)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Print per-trade calculation details')
     parser.add_argument('--quiet', '-q', action='store_true',
-                        help='Suppress verbose output')
+                        help='Suppress per-trade output (default; overrides --verbose)')
+    parser.add_argument('--append', action='store_true',
+                        help='Update an existing output file in place, keeping an unchanged Methodology sheet')
     
     args = parser.parse_args()
     
@@ -671,7 +1091,9 @@ Input File Requirements:
             args.input_file, 
             args.output_file, 
             tenor=args.tenor,
-            verbose=not args.quiet
+            verbose=args.verbose and not args.quiet,
+            engine=args.engine,
+            append=args.append
         )
     except Exception as e:
         print(f"\nError: {e}")
@@ -4,40 +4,94 @@ Forward Points Extraction - With Manual Fallback
 Provides multiple methods to get forward points when automated scraping fails
 """
 
+import json
 import sys
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+
+BANNER = "=" * 70
+
+# Answers accepted as "yes" at y/n prompts
+_YES = frozenset({'y', 'Y', 'yes', 'Yes', 'YES'})
+
+# Tenors and the day counts used for the parity estimate
+_TENORS = ('1M', '3M', '6M')
+_DAYS = np.array([30, 90, 180], dtype=np.float64)
+
+# Saved forward points file; same layout as json.dump(..., indent=2).
+# Values are filled in with json.dumps, so nan/inf are written as JSON
+# NaN/Infinity just as json.dump would
+_SAVE_TEMPLATE = (
+    '{{\n'
+    '  "date": "{date}",\n'
+    '  "forward_points": {{\n'
+    '    "1M": {fp_1m},\n'
+    '    "3M": {fp_3m},\n'
+    '    "6M": {fp_6m}\n'
+    '  }}\n'
+    '}}'
+)
+
+def _next_answer(prompt):
+    """
+    input() for interactive use; when stdin is piped, the prompt is written
+    and one line read straight from the buffered stdin (blank lines are
+    kept as empty answers). Raises EOFError when input runs out.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("No more input")
+    return line.rstrip("\r\n")
+
+
+def _ask_float(prompt):
+    """
+    Ask for a numeric answer, asking again after a typo at a terminal;
+    piped input raises ValueError instead, as there is nobody to re-ask
+    """
+    while True:
+        try:
+            return float(_next_answer(prompt))
+        except ValueError:
+            if not sys.stdin.isatty():
+                raise
+            print("  (numeric only)")
+
+
+def _read_floats(n, prompts):
+    """Read n numeric answers, one per prompt"""
+    return [_ask_float(prompt) for prompt in prompts[:n]]
+
 
 def manual_forward_points_input():
     """
     Manual input mode for forward points
     Use this when automated extraction fails
     """
-    print("\n" + "=" * 70)
-    print("MANUAL FORWARD POINTS INPUT MODE")
-    print("=" * 70)
-    print("\n📋 Please open one of these sources in your browser:")
-    print("   1. https://www.investing.com/currencies/usd-sgd-forward-rates")
-    print("   2. Your broker platform (e.g., OCBC, DBS, SAXO)")
-    print("   3. Bloomberg Terminal (if you have access)")
-    print("\n")
-    
-    print("Enter the BID and ASK values for each tenor:")
-    print("(Script will calculate mid rates automatically)\n")
+    print(f"\n{BANNER}\n"
+          "MANUAL FORWARD POINTS INPUT MODE\n"
+          f"{BANNER}\n"
+          "\n📋 Please open one of these sources in your browser:\n"
+          "   1. https://www.investing.com/currencies/usd-sgd-forward-rates\n"
+          "   2. Your broker platform (e.g., OCBC, DBS, SAXO)\n"
+          "   3. Bloomberg Terminal (if you have access)\n"
+          "\n\n"
+          "Enter the BID and ASK values for each tenor:\n"
+          "(Script will calculate mid rates automatically)\n")
     
     try:
-        # 1-month
-        print("1-MONTH FORWARD:")
-        fp_1m_bid = float(input("  Bid: "))
-        fp_1m_ask = float(input("  Ask: "))
-        
-        # 3-month
-        print("\n3-MONTH FORWARD:")
-        fp_3m_bid = float(input("  Bid: "))
-        fp_3m_ask = float(input("  Ask: "))
-        
-        # 6-month
-        print("\n6-MONTH FORWARD:")
-        fp_6m_bid = float(input("  Bid: "))
-        fp_6m_ask = float(input("  Ask: "))
+        # Bid/ask for 1-month, 3-month and 6-month
+        fp_1m_bid, fp_1m_ask, fp_3m_bid, fp_3m_ask, fp_6m_bid, fp_6m_ask = _read_floats(6, [
+            "1-MONTH FORWARD:\n  Bid: ", "  Ask: ",
+            "\n3-MONTH FORWARD:\n  Bid: ", "  Ask: ",
+            "\n6-MONTH FORWARD:\n  Bid: ", "  Ask: "
+        ])
         
         # Calculate mid rates
         forward_points = {
@@ -46,26 +100,53 @@ def manual_forward_points_input():
             '6M': round((fp_6m_bid + fp_6m_ask) / 2, 4)
         }
         
-        print("\n" + "=" * 70)
-        print("CALCULATED MID RATES:")
-        print("=" * 70)
-        for period, value in forward_points.items():
-            print(f"  {period}: {value} pips")
-        print("=" * 70)
+        body = "\n".join(f"  {period}: {value} pips" for period, value in forward_points.items())
+        print(f"\n{BANNER}\nCALCULATED MID RATES:\n{BANNER}\n{body}\n{BANNER}")
         
-        confirm = input("\nAre these values correct? (y/n): ")
-        if confirm.lower() != 'y':
+        confirm = _next_answer("\nAre these values correct? (y/n): ")
+        if confirm.strip() not in _YES:
             print("Cancelled. Please run again.")
             return None
         
         return forward_points
         
-    except ValueError as e:
-        print(f"\n✗ Error: Invalid input. Please enter numeric values only.")
+    except ValueError:
+        print("\n✗ Error: Invalid input. Please enter numeric values only.")
         return None
     except KeyboardInterrupt:
         print("\n\nCancelled by user.")
         return None
+    except EOFError:
+        print("\n\nNo more input. Cancelled.")
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _irp_forward_points(spot_rate, sofr_rates, sora_rates):
+    """
+    Forward points by interest rate parity (pure, cached)
+    
+    Args:
+        spot_rate: USD/SGD spot rate
+        sofr_rates: tuple of SOFR rates (in %) in _TENORS order
+        sora_rates: tuple of SORA rates (in %) in _TENORS order
+    
+    Returns:
+        Tuple of forward points in _TENORS order
+    """
+    # Convert percentages to decimal in one pass: SOFR tenors, then SORA
+    rates = np.array(sofr_rates + sora_rates, dtype=np.float64) / 100
+    sofr = rates[:len(_TENORS)]
+    sora = rates[len(_TENORS):]
+    
+    # Interest rate parity formula, all tenors at once
+    forward_rate = spot_rate * (
+        (1 + sofr * _DAYS / 360) /
+        (1 + sora * _DAYS / 360)
+    )
+    
+    # Convert to pips (multiply by 10000)
+    return tuple(np.round((forward_rate - spot_rate) * 10000, 4).tolist())
 
 
 def calculate_forward_points_from_rates(spot_rate, sofr_rates, sora_rates=None):
@@ -80,59 +161,41 @@ def calculate_forward_points_from_rates(spot_rate, sofr_rates, sora_rates=None):
     Returns:
         Dict with '1M', '3M', '6M' forward points
     """
+    sofr = tuple(sofr_rates[k] for k in _TENORS)
+    
     # If SORA rates not provided, estimate as SOFR - 0.5%
     if sora_rates is None:
         print("⚠ SORA rates not provided. Using SOFR - 0.5% as estimate.")
-        sora_rates = {
-            '1M': sofr_rates['1M'] - 0.5,
-            '3M': sofr_rates['3M'] - 0.5,
-            '6M': sofr_rates['6M'] - 0.5
-        }
-    
-    # Convert percentages to decimal
-    sofr_decimal = {k: v / 100 for k, v in sofr_rates.items()}
-    sora_decimal = {k: v / 100 for k, v in sora_rates.items()}
-    
-    # Days for each tenor
-    days_map = {'1M': 30, '3M': 90, '6M': 180}
-    
-    forward_points = {}
+        sora = tuple(rate - 0.5 for rate in sofr)
+    else:
+        sora = tuple(sora_rates[k] for k in _TENORS)
     
-    for period, days in days_map.items():
-        sofr = sofr_decimal[period]
-        sora = sora_decimal[period]
-        
-        # Interest rate parity formula
-        forward_rate = spot_rate * (
-            (1 + sofr * days / 360) / 
-            (1 + sora * days / 360)
-        )
-        
-        # Convert to pips (multiply by 10000)
-        fp = (forward_rate - spot_rate) * 10000
-        forward_points[period] = round(fp, 4)
+    fp = _irp_forward_points(spot_rate, sofr, sora)
+    forward_points = dict(zip(_TENORS, fp))
     
-    print("\n✓ Forward points calculated from interest rate parity:")
-    for period, value in forward_points.items():
-        print(f"  {period}: {value} pips (estimated)")
+    body = "\n".join(f"  {period}: {value} pips (estimated)" for period, value in forward_points.items())
+    print(f"\n✓ Forward points calculated from interest rate parity:\n{body}")
     
     return forward_points
 
 
 def main():
     """Interactive CLI for getting forward points"""
-    print("=" * 70)
-    print("USD/SGD FORWARD POINTS - INTERACTIVE INPUT")
-    print("=" * 70)
-    print("\nThis tool helps you input forward points data manually.")
-    print("Use this when automated extraction from websites fails.\n")
+    # Block-buffer output when it goes to a pipe or log file
+    if not sys.stdout.isatty() and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
     
-    print("Choose an option:")
-    print("  1. Manual input (from browser/broker)")
-    print("  2. Calculate from SOFR + SORA rates")
-    print("  3. Exit")
+    print(f"{BANNER}\n"
+          "USD/SGD FORWARD POINTS - INTERACTIVE INPUT\n"
+          f"{BANNER}\n"
+          "\nThis tool helps you input forward points data manually.\n"
+          "Use this when automated extraction from websites fails.\n\n"
+          "Choose an option:\n"
+          "  1. Manual input (from browser/broker)\n"
+          "  2. Calculate from SOFR + SORA rates\n"
+          "  3. Exit")
     
-    choice = input("\nYour choice (1-3): ")
+    choice = _next_answer("\nYour choice (1-3): ")
     
     if choice == '1':
         forward_points = manual_forward_points_input()
@@ -141,38 +204,34 @@ def main():
             print(forward_points)
             
             # Save to file option
-            save = input("\nSave to file? (y/n): ")
-            if save.lower() == 'y':
-                import json
-                from datetime import datetime
-                
+            save = _next_answer("\nSave to file? (y/n): ")
+            if save.strip() in _YES:
                 filename = f"forward_points_{datetime.now().strftime('%Y%m%d')}.json"
                 with open(filename, 'w') as f:
-                    json.dump({
-                        'date': datetime.now().isoformat(),
-                        'forward_points': forward_points
-                    }, f, indent=2)
+                    f.write(_SAVE_TEMPLATE.format(
+                        date=datetime.now().isoformat(),
+                        fp_1m=json.dumps(forward_points['1M']),
+                        fp_3m=json.dumps(forward_points['3M']),
+                        fp_6m=json.dumps(forward_points['6M'])
+                    ))
                 print(f"✓ Saved to {filename}")
     
     elif choice == '2':
         print("\nCalculating from interest rates...")
         print("\nEnter SOFR rates (in %, e.g., 4.50 for 4.50%):")
         try:
-            sofr_1m = float(input("  1M SOFR: "))
-            sofr_3m = float(input("  3M SOFR: "))
-            sofr_6m = float(input("  6M SOFR: "))
-            
-            spot = float(input("\nEnter USD/SGD spot rate (e.g., 1.3450): "))
+            sofr_1m, sofr_3m, sofr_6m, spot = _read_floats(4, [
+                "  1M SOFR: ", "  3M SOFR: ", "  6M SOFR: ",
+                "\nEnter USD/SGD spot rate (e.g., 1.3450): "
+            ])
             
             print("\nDo you have SORA rates? (y/n): ")
-            has_sora = input().lower() == 'y'
+            has_sora = _next_answer("").strip() in _YES
             
             sora_rates = None
             if has_sora:
                 print("\nEnter SORA rates (in %):")
-                sora_1m = float(input("  1M SORA: "))
-                sora_3m = float(input("  3M SORA: "))
-                sora_6m = float(input("  6M SORA: "))
+                sora_1m, sora_3m, sora_6m = _read_floats(3, ["  1M SORA: ", "  3M SORA: ", "  6M SORA: "])
                 sora_rates = {'1M': sora_1m, '3M': sora_3m, '6M': sora_6m}
             
             sofr_rates = {'1M': sofr_1m, '3M': sofr_3m, '6M': sofr_6m}
@@ -184,6 +243,8 @@ def main():
             
         except ValueError:
             print("\n✗ Invalid input. Please enter numeric values.")
+        except EOFError:
+            print("\n\nNo more input. Cancelled.")
     
     elif choice == '3':
         print("Exiting...")
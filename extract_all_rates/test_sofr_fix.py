@@ -6,6 +6,8 @@ and not confused with 12-month
 
 from bs4 import BeautifulSoup
 
+from update_swap_implied_data import HTML_PARSER, _clean_rate, _match_tenor
+
 # Sample HTML matching the actual structure from global-rates.com
 sample_html = """
 <table class="tablesorter">
@@ -28,10 +30,12 @@ sample_html = """
 </table>
 """
 
+# Parsed once; the test only reads the tree
+_SAMPLE_SOUP = BeautifulSoup(sample_html, HTML_PARSER)
+
 def test_sofr_extraction():
     """Test the extraction logic"""
-    soup = BeautifulSoup(sample_html, 'html.parser')
-    table = soup.find('table')
+    table = _SAMPLE_SOUP.find('table')
     
     sofr_rates = {}
     rows = table.find_all('tr')
@@ -42,20 +46,13 @@ def test_sofr_extraction():
             tenor = cells[0].get_text(strip=True).lower()
             rate = cells[1].get_text(strip=True)
             
-            # Clean rate
-            cleaned = ''.join(c for c in rate if c.isdigit() or c in '.-')
-            rate_value = float(cleaned)
-            
-            # Match exact tenors - be specific to avoid matching "1" in "12"
-            if ('1 month' in tenor or '1-month' in tenor or '1month' in tenor) and '12' not in tenor:
-                sofr_rates['1M'] = rate_value
-                print(f"✓ Matched 1M: '{tenor}' -> {rate_value}%")
-            elif '3 month' in tenor or '3-month' in tenor or '3month' in tenor:
-                sofr_rates['3M'] = rate_value
-                print(f"✓ Matched 3M: '{tenor}' -> {rate_value}%")
-            elif '6 month' in tenor or '6-month' in tenor or '6month' in tenor:
-                sofr_rates['6M'] = rate_value
-                print(f"✓ Matched 6M: '{tenor}' -> {rate_value}%")
+            # Clean rate and match exact tenors with the production helpers
+            # ("1" in "12" must not match)
+            rate_value = _clean_rate(rate)
+            period = _match_tenor(tenor)
+            if period:
+                sofr_rates[period] = rate_value
+                print(f"✓ Matched {period}: '{tenor}' -> {rate_value}%")
             elif '12 month' in tenor or '12-month' in tenor or '12month' in tenor:
                 print(f"  Skipped 12M: '{tenor}' -> {rate_value}% (correctly ignored)")
     
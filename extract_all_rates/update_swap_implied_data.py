@@ -15,43 +15,177 @@ Usage:
 
 import argparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
+import numpy as np
+from openpyxl import load_workbook
 from pathlib import Path
+import random
+import re
 import sys
-import time
+
+# lxml's C parser is several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional on-disk HTTP cache, so re-runs within the hour skip the network
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+# Seconds a cached page stays valid
+HTTP_CACHE_EXPIRY = 3600
+
+# Only the rates tables are needed from the scraped pages
+SOFR_TABLE_STRAINER = SoupStrainer('table', {'class': 'tablesorter'})
+TABLE_STRAINER = SoupStrainer('table')
+
+# Everything that is not part of a number (%, commas, spaces, ...)
+_RATE_RE = re.compile(r'[^0-9.\-]+')
+
+# A plain decimal number, checked before float() so non-numeric cells
+# (headers, "-", ".") return None without raising
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+# "1 month", "3-month", "6month" - but not "12 month"
+_TENOR_RE = re.compile(r'(?<!\d)([136])[-\s]?month')
+_TENOR_MAP = {'1': '1M', '3': '3M', '6': '6M'}
+
+# Upper bound on a scraped page body; the tables needed are a small part of it
+MAX_PAGE_BYTES = 2_000_000
+
+# Tenors and day counts for calculate_forward_points
+_PERIODS = ('1M', '3M', '6M')
+_PERIOD_DAYS = np.array([30, 90, 180], dtype=np.float64)
 
 class DataExtractor:
     """Handles extraction of financial data from various sources"""
     
-    def __init__(self, use_selenium=False):
+    SOFR_URL = "https://www.global-rates.com/en/interest-rates/cme-term-sofr/"
+    FORWARD_POINTS_URL = "https://www.investing.com/currencies/usd-sgd-forward-rates"
+    EXCHANGERATE_API_URL = "https://open.er-api.com/v6/latest/USD"
+    
+    # ChromeDriverManager().install() result, shared by all extractors
+    _chromedriver_path = None
+    
+    def __init__(self, use_selenium=False, use_cache=True, session=None):
         self.use_selenium = use_selenium
+        self._prefetched = {}
+        self._driver = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         }
+        
+        # A caller-supplied session (e.g. one shared with other scrapers in
+        # the same process) is used as-is, keeping its pool and retry policy
+        if session is not None:
+            self.session = session
+            self.session.headers.update(self.headers)
+            return
+        
+        # One keep-alive session for all requests in a run, retrying
+        # transient failures with jittered exponential backoff. With
+        # requests-cache installed, successful GETs are also cached on disk.
+        if use_cache and CachedSession is not None:
+            self.session = CachedSession(
+                '.http_cache',
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRY,
+                allowable_methods=('GET',),
+                allowable_codes=(200,)
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = _JitteredRetry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def prefetch(self, include_forward_points=True):
+        """
+        Fetch the SOFR, FX and forward points sources concurrently
+        
+        The sites are independent, so the requests are issued from parallel
+        threads and the responses (or errors) stored; the extract_* methods
+        then parse them in their usual order. Requests mode only.
+        """
+        urls = {self.SOFR_URL: 15, self.EXCHANGERATE_API_URL: 10}
+        if include_forward_points:
+            urls[self.FORWARD_POINTS_URL] = 15
+        
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            futures = {url: executor.submit(self.session.get, url, timeout=timeout, stream=True)
+                       for url, timeout in urls.items()}
+        
+        for url, future in futures.items():
+            try:
+                self._prefetched[url] = future.result()
+            except Exception as e:
+                self._prefetched[url] = e
+    
+    def _get(self, url, timeout):
+        """
+        Streamed GET through the session, using a prefetched response if
+        there is one (read the body with _read_capped or .json())
+        """
+        prefetched = self._prefetched.pop(url, None)
+        if prefetched is None:
+            return self.session.get(url, timeout=timeout, stream=True)
+        if isinstance(prefetched, Exception):
+            raise prefetched
+        return prefetched
+    
+    def close(self):
+        """Quit the Selenium browser (if started) and release pooled connections"""
+        self._quit_driver()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def extract_sofr_rates(self):
         """
         Extract 1M, 3M, and 6M SOFR rates from global-rates.com
         Returns: dict with keys '1M', '3M', '6M'
         """
-        url = "https://www.global-rates.com/en/interest-rates/cme-term-sofr/"
+        url = self.SOFR_URL
         
         try:
             print("Extracting SOFR rates...")
             
             if self.use_selenium:
                 print("  Using Selenium mode (may take 15-30 seconds)...")
-                soup = self._fetch_with_selenium(url)
+                soup = self._fetch_with_selenium(url, 'table.tablesorter tr td')
             else:
                 print("  Using requests mode (fast)...")
                 try:
-                    response = requests.get(url, headers=self.headers, timeout=15)
+                    response = self._get(url, timeout=15)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    content = _read_capped(response)
+                    soup = BeautifulSoup(content, HTML_PARSER, parse_only=SOFR_TABLE_STRAINER)
+                    if not soup.find('table'):
+                        # Layout changed - parse the whole page for the search below
+                        soup = BeautifulSoup(content, HTML_PARSER)
                 except requests.exceptions.RequestException as e:
                     print(f"  Request failed: {e}")
                     print(f"  Tip: Try running with --selenium flag")
@@ -79,22 +213,20 @@ class DataExtractor:
             if table:
                 rows = table.find_all('tr')
                 for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                    # Only the tenor and rate cells are used
+                    cells = row.find_all(['td', 'th'], limit=2)
                     if len(cells) >= 2:
                         tenor = cells[0].get_text(strip=True).lower()
                         rate = cells[1].get_text(strip=True)
                         
-                        # Match exact tenors - be specific to avoid matching "1" in "12"
-                        # Look for "1 month" but NOT "12 month"
-                        if ('1 month' in tenor or '1-month' in tenor or '1month' in tenor) and '12' not in tenor:
-                            sofr_rates['1M'] = self._clean_rate(rate)
-                            print(f"  ✓ 1M: {sofr_rates['1M']}%")
-                        elif '3 month' in tenor or '3-month' in tenor or '3month' in tenor:
-                            sofr_rates['3M'] = self._clean_rate(rate)
-                            print(f"  ✓ 3M: {sofr_rates['3M']}%")
-                        elif '6 month' in tenor or '6-month' in tenor or '6month' in tenor:
-                            sofr_rates['6M'] = self._clean_rate(rate)
-                            print(f"  ✓ 6M: {sofr_rates['6M']}%")
+                        period = _match_tenor(tenor)
+                        if period:
+                            sofr_rates[period] = _clean_rate(rate)
+                            print(f"  ✓ {period}: {sofr_rates[period]}%")
+                            
+                            # All tenors found - skip the remaining rows
+                            if len(sofr_rates) == 3:
+                                break
             
             if len(sofr_rates) == 3:
                 print(f"✓ SOFR rates extracted: 1M={sofr_rates['1M']}%, 3M={sofr_rates['3M']}%, 6M={sofr_rates['6M']}%")
@@ -114,20 +246,20 @@ class DataExtractor:
         Returns mid rates (average of bid and ask)
         Returns: dict with keys '1M', '3M', '6M'
         """
-        url = "https://www.investing.com/currencies/usd-sgd-forward-rates"
+        url = self.FORWARD_POINTS_URL
         
         try:
             print("Extracting forward points...")
             
             if self.use_selenium:
                 print("  Using Selenium mode (may take 15-30 seconds)...")
-                soup = self._fetch_with_selenium(url, wait_for_table=True)
+                soup = self._fetch_with_selenium(url, 'table', wait_text='USDSGD')
             else:
                 print("  Using requests mode (fast)...")
                 try:
-                    response = requests.get(url, headers=self.headers, timeout=15)
+                    response = self._get(url, timeout=15)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(_read_capped(response), HTML_PARSER, parse_only=TABLE_STRAINER)
                 except requests.exceptions.RequestException as e:
                     print(f"  Request failed: {e}")
                     print(f"  Tip: Try running with --selenium flag for more reliable extraction")
@@ -147,14 +279,16 @@ class DataExtractor:
             }
             
             forward_points = {}
+            target_items = tuple(target_periods.items())
             rows = table.find_all('tr')
             
             for row in rows:
-                cells = row.find_all('td')
+                # Only the name, bid and ask cells are used
+                cells = row.find_all('td', limit=3)
                 if len(cells) >= 3:
                     name = cells[0].get_text(strip=True)
                     
-                    for target_name, period in target_periods.items():
+                    for target_name, period in target_items:
                         if target_name in name:
                             try:
                                 bid_text = cells[1].get_text(strip=True)
@@ -167,6 +301,11 @@ class DataExtractor:
                                 print(f"  ✓ {period}: Bid={bid}, Ask={ask}, Mid={mid}")
                             except (ValueError, IndexError) as e:
                                 print(f"  Warning: Could not parse {period} forward points: {e}")
+                            break
+                    
+                    # All tenors found - skip the remaining rows
+                    if len(forward_points) == 3:
+                        break
             
             if len(forward_points) == 3:
                 print(f"✓ Forward points extracted: 1M={forward_points['1M']}, 3M={forward_points['3M']}, 6M={forward_points['6M']}")
@@ -209,8 +348,8 @@ class DataExtractor:
     
     def _get_fx_from_exchangerate_api(self):
         """Get FX rate from exchangerate-api.com (free, no key required)"""
-        url = "https://open.er-api.com/v6/latest/USD"
-        response = requests.get(url, timeout=10)
+        url = self.EXCHANGERATE_API_URL
+        response = self._get(url, timeout=10)
         data = response.json()
         if data.get('result') == 'success' and 'SGD' in data.get('rates', {}):
             return round(data['rates']['SGD'], 4)
@@ -224,7 +363,7 @@ class DataExtractor:
             return None
         
         url = f"http://data.fixer.io/api/latest?access_key={api_key}&symbols=SGD"
-        response = requests.get(url, timeout=10)
+        response = self.session.get(url, timeout=10)
         data = response.json()
         if data.get('success') and 'SGD' in data.get('rates', {}):
             # Fixer uses EUR as base, need to convert to USD
@@ -236,8 +375,11 @@ class DataExtractor:
     def _get_fx_from_xe(self):
         """Scrape FX rate from XE.com"""
         url = "https://www.xe.com/currencyconverter/convert/?Amount=1&From=USD&To=SGD"
-        response = requests.get(url, headers=self.headers, timeout=15)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = self._get(url, timeout=15)
+        
+        # Only the conversion result paragraph is needed
+        strainer = SoupStrainer('p', {'class': 'result__BigRate-sc-1bsijpp-1'})
+        soup = BeautifulSoup(_read_capped(response), HTML_PARSER, parse_only=strainer)
         
         # Look for the conversion result
         result = soup.find('p', {'class': 'result__BigRate-sc-1bsijpp-1'})
@@ -248,18 +390,55 @@ class DataExtractor:
             return round(rate, 4)
         return None
     
-    def _fetch_with_selenium(self, url, wait_for_table=False):
-        """Fetch page using Selenium"""
+    def _fetch_with_selenium(self, url, wait_css='table tr td', wait_text=None, timeout=15):
+        """
+        Fetch page using Selenium, returning as soon as an element matching
+        wait_css (containing wait_text, if given) is present
+        """
         try:
-            from selenium import webdriver
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.chrome.options import Options
             from selenium.common.exceptions import TimeoutException, WebDriverException
         except ImportError as e:
             raise Exception(f"Selenium not installed. Install with: pip install selenium webdriver-manager")
         
+        try:
+            driver = self._get_driver()
+            
+            print(f"  Loading {url}...")
+            driver.get(url)
+            
+            print("  Waiting for table to load...")
+            locator = (By.CSS_SELECTOR, wait_css)
+            if wait_text:
+                condition = EC.text_to_be_present_in_element(locator, wait_text)
+            else:
+                condition = EC.presence_of_element_located(locator)
+            WebDriverWait(driver, timeout).until(condition)
+            
+            print("  Parsing page content...")
+            soup = BeautifulSoup(driver.page_source, HTML_PARSER)
+            return soup
+            
+        except TimeoutException as e:
+            self._quit_driver()
+            raise Exception(f"Page load timeout: {str(e)}")
+        except WebDriverException as e:
+            self._quit_driver()
+            raise Exception(f"WebDriver error: {str(e)}")
+        except Exception as e:
+            self._quit_driver()
+            raise Exception(f"Selenium error: {str(e)}")
+    
+    def _get_driver(self):
+        """Start headless Chrome on first use; later fetches reuse the same browser"""
+        if self._driver is not None:
+            return self._driver
+        
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         try:
             from webdriver_manager.chrome import ChromeDriverManager
             from selenium.webdriver.chrome.service import Service
@@ -277,58 +456,107 @@ class DataExtractor:
         chrome_options.add_argument('--log-level=3')
         chrome_options.add_argument(f'--user-agent={self.headers["User-Agent"]}')
         
-        # Set page load timeout
-        chrome_options.page_load_strategy = 'normal'
+        # Only the HTML tables are scraped - skip images, stylesheets and other extras
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'permissions.default.stylesheet': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-plugins')
+        chrome_options.add_argument('--disable-features=TranslateUI,AutofillServerCommunication')
         
-        driver = None
-        try:
-            print("  Starting Chrome browser...")
-            if use_manager:
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-            
-            # Set timeouts
-            driver.set_page_load_timeout(30)  # 30 seconds for page load
-            driver.set_script_timeout(30)      # 30 seconds for scripts
-            
-            print(f"  Loading {url}...")
-            driver.get(url)
-            
-            if wait_for_table:
-                print("  Waiting for table to load...")
-                wait = WebDriverWait(driver, 15)
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-            
-            # Give extra time for dynamic content
-            time.sleep(2)
-            
-            print("  Parsing page content...")
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            return soup
-            
-        except TimeoutException as e:
-            raise Exception(f"Page load timeout: {str(e)}")
-        except WebDriverException as e:
-            raise Exception(f"WebDriver error: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Selenium error: {str(e)}")
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
-    
-    def _clean_rate(self, rate_str):
-        """Clean and convert rate string to float"""
-        # Remove %, commas, and other characters
-        cleaned = ''.join(c for c in rate_str if c.isdigit() or c in '.-')
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+        # Return once the DOM is ready instead of waiting for every subresource
+        chrome_options.page_load_strategy = 'eager'
+        
+        print("  Starting Chrome browser...")
+        if use_manager:
+            if DataExtractor._chromedriver_path is None:
+                DataExtractor._chromedriver_path = ChromeDriverManager().install()
+            service = Service(DataExtractor._chromedriver_path)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        else:
+            driver = webdriver.Chrome(options=chrome_options)
+        
+        # Set timeouts
+        driver.set_page_load_timeout(30)  # 30 seconds for page load
+        driver.set_script_timeout(30)      # 30 seconds for scripts
+        
+        self._driver = driver
+        return driver
+    
+    def _quit_driver(self):
+        """Quit the cached browser, if any"""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+
+def _match_tenor(text):
+    """'1M', '3M' or '6M' for a lower-cased tenor label, None for other tenors"""
+    # Match exact tenors - the regex will not match "1" in "12"
+    match = _TENOR_RE.search(text)
+    return _TENOR_MAP[match.group(1)] if match else None
+
+
+def _clean_rate(rate_str):
+    """Clean and convert rate string to float"""
+    # Remove %, commas, and other characters
+    cleaned = _RATE_RE.sub('', rate_str)
+    return float(cleaned) if _NUMBER_RE.fullmatch(cleaned) else None
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry sleeping a random fraction of the exponential backoff (full jitter)"""
+    
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
+
+
+def _read_capped(response, limit=MAX_PAGE_BYTES):
+    """Read a streamed response body, refusing bodies larger than limit bytes"""
+    with response:
+        content = response.raw.read(limit + 1, decode_content=True)
+    if len(content) > limit:
+        raise requests.exceptions.RequestException(
+            f"Response from {response.url} is larger than {limit} bytes")
+    return content
+
+
+# Date cells stored as ISO text ('YYYY-MM-DD', optionally with a time)
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _has_date(values, day, day_str):
+    """
+    True if any Date cell in values falls on day
+    
+    datetime cells and 'YYYY-MM-DD' strings are compared directly; any
+    other text dates ('10/15/2026', '15 Oct 2026') are parsed together
+    with pandas, as the whole column used to be
+    """
+    other_text = []
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, datetime):
+            if value.date() == day:
+                return True
+            continue
+        text = str(value).strip()
+        if text[:10] == day_str:
+            return True
+        if not _ISO_DATE_RE.match(text):
+            other_text.append(text)
+    
+    if not other_text:
+        return False
+    import pandas as pd
+    parsed = pd.to_datetime(pd.Series(other_text), errors='coerce', format='mixed')
+    return bool((parsed.dt.date == day).any())
 
 
 class DataUpdater:
@@ -356,7 +584,7 @@ class DataUpdater:
         print("✓ All master files found")
         return True
     
-    def update_files(self, sofr_rates, fx_rate, forward_points):
+    def update_files(self, sofr_rates, fx_rate, forward_points, on_updated=None):
         """
         Append new data to all master files
         
@@ -364,54 +592,91 @@ class DataUpdater:
             sofr_rates: dict with keys '1M', '3M', '6M'
             fx_rate: float
             forward_points: dict with keys '1M', '3M', '6M'
+            on_updated: Optional callback(period, status), called from the
+                worker thread as soon as each file is done, so follow-up
+                work on that file can start before the others finish
         """
-        today = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        periods = ['1M', '3M', '6M']
+        
+        # Build each file's new row once, in the master file column order
+        new_rows = {
+            period: {
+                'Date': today,
+                f'{period[0]}mSOFR': sofr_rates[period],
+                'USDSGD_FX': fx_rate,
+                'ForwardPoints': forward_points[period]
+            }
+            for period in periods
+        }
+        
+        # The three files are independent: load/append/save them in parallel
+        # and print each file's messages in order afterwards
+        def update(period):
+            outcome = self._update_file(period, new_rows[period], now.date())
+            if on_updated is not None:
+                on_updated(period, outcome[0])
+            return outcome
+        
+        with ThreadPoolExecutor(max_workers=len(periods)) as executor:
+            outcomes = list(executor.map(update, periods))
         
         results = {}
-        for period in ['1M', '3M', '6M']:
-            filepath = self.files[period]
-            
-            try:
-                print(f"\nUpdating {filepath.name}...")
-                
-                # Read existing data
-                df = pd.read_excel(filepath)
-                
-                # Validate columns
-                expected_cols = ['Date', f'{period[0]}mSOFR', 'USDSGD_FX', 'ForwardPoints']
-                if list(df.columns) != expected_cols:
-                    print(f"  Warning: Column mismatch. Expected {expected_cols}, got {list(df.columns)}")
-                
-                # Check if today's data already exists
-                if 'Date' in df.columns:
-                    df['Date'] = pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d')
-                    if today in df['Date'].values:
-                        print(f"  ⚠ Data for {today} already exists. Skipping...")
-                        results[period] = 'skipped'
-                        continue
-                
-                # Create new row
-                new_row = {
-                    'Date': today,
-                    f'{period[0]}mSOFR': sofr_rates[period],
-                    'USDSGD_FX': fx_rate,
-                    'ForwardPoints': forward_points[period]
-                }
-                
-                # Append new row
-                df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                
-                # Save back to file
-                df.to_excel(filepath, index=False)
-                
-                print(f"  ✓ Successfully appended: Date={today}, SOFR={sofr_rates[period]}%, FX={fx_rate}, FP={forward_points[period]}")
-                results[period] = 'success'
-                
-            except Exception as e:
-                print(f"  ✗ Error updating {filepath.name}: {e}")
-                results[period] = 'failed'
+        for period, (status, messages) in zip(periods, outcomes):
+            print("\n".join(messages))
+            results[period] = status
         
         return results
+    
+    def _update_file(self, period, new_row, day):
+        """
+        Append today's row (new_row, keyed by column name) to one master file
+        
+        Returns:
+            tuple: (status, list of messages) - status is 'success',
+            'skipped' or 'failed'
+        """
+        filepath = self.files[period]
+        today = new_row['Date']
+        messages = [f"\nUpdating {filepath.name}..."]
+        
+        try:
+            # Open the existing workbook; the new row is appended in place
+            wb = load_workbook(filepath)
+            ws = wb.active
+            
+            # Validate columns
+            expected_cols = list(new_row)
+            header = [cell.value for cell in ws[1]]
+            if header != expected_cols:
+                messages.append(f"  Warning: Column mismatch. Expected {expected_cols}, got {header}")
+            
+            # Check if today's data already exists (single scan of the Date column)
+            if 'Date' in header:
+                date_col = header.index('Date') + 1
+                dates = next(ws.iter_cols(min_col=date_col, max_col=date_col, min_row=2,
+                                          values_only=True), ())
+                if _has_date(dates, day, today):
+                    messages.append(f"  ⚠ Data for {today} already exists. Skipping...")
+                    return 'skipped', messages
+            
+            # Append new row, matching the file's column order where possible
+            if set(new_row) <= set(header):
+                ws.append([new_row.get(col) for col in header])
+            else:
+                ws.append(list(new_row.values()))
+            
+            # Save back to file
+            wb.save(filepath)
+            
+            _, sofr, fx_rate, fwd_points = new_row.values()
+            messages.append(f"  ✓ Successfully appended: Date={today}, SOFR={sofr}%, FX={fx_rate}, FP={fwd_points}")
+            return 'success', messages
+            
+        except Exception as e:
+            messages.append(f"  ✗ Error updating {filepath.name}: {e}")
+            return 'failed', messages
 
 
 def manual_forward_points_input():
@@ -449,15 +714,12 @@ def calculate_forward_points(spot_rate, sofr_rates, sora_rates=None):
         print("⚠ SORA rates not provided, estimating as SOFR - 0.5%")
         sora_rates = {k: v - 0.5 for k, v in sofr_rates.items()}
     
-    days_map = {'1M': 30, '3M': 90, '6M': 180}
-    forward_points = {}
-    
-    for period, days in days_map.items():
-        sofr = sofr_rates[period] / 100  # Convert to decimal
-        sora = sora_rates[period] / 100
-        forward_rate = spot_rate * ((1 + sofr * days / 360) / (1 + sora * days / 360))
-        fp = (forward_rate - spot_rate) * 10000
-        forward_points[period] = round(fp, 4)
+    # All tenors in one array expression
+    sofr = np.fromiter((sofr_rates[p] for p in _PERIODS), dtype=np.float64) / 100  # Convert to decimal
+    sora = np.fromiter((sora_rates[p] for p in _PERIODS), dtype=np.float64) / 100
+    forward_rate = spot_rate * ((1 + sofr * _PERIOD_DAYS / 360) / (1 + sora * _PERIOD_DAYS / 360))
+    fp = (forward_rate - spot_rate) * 10000
+    forward_points = {p: round(float(value), 4) for p, value in zip(_PERIODS, fp)}
     
     print(f"✓ Calculated forward points: 1M={forward_points['1M']}, 3M={forward_points['3M']}, 6M={forward_points['6M']}")
     return forward_points
@@ -488,6 +750,11 @@ def main():
         action='store_true',
         help='Calculate forward points from SOFR+SORA rates instead of scraping'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always fetch fresh pages, bypassing the requests-cache HTTP cache'
+    )
     parser.add_argument(
         '--create-sample',
         action='store_true',
@@ -506,8 +773,15 @@ def main():
         create_sample_files(args.input_dir)
         return 0
     
-    # Initialize
-    extractor = DataExtractor(use_selenium=args.selenium)
+    extractor = DataExtractor(use_selenium=args.selenium, use_cache=not args.no_cache)
+    try:
+        return run_update(args, extractor)
+    finally:
+        extractor.close()
+
+
+def run_update(args, extractor):
+    """Extract today's data and append it to the master files"""
     updater = DataUpdater(input_dir=args.input_dir)
     
     # Validate files exist
@@ -519,6 +793,10 @@ def main():
     print("EXTRACTING DATA FROM SOURCES")
     print("-" * 70)
     
+    # Fetch the independent sources in parallel, then extract in order
+    if not extractor.use_selenium:
+        extractor.prefetch(include_forward_points=not (args.manual or args.calculate))
+    
     # Extract data from all sources
     sofr_rates = extractor.extract_sofr_rates()
     fx_rate = extractor.extract_usdsgd_fx()
@@ -595,6 +873,11 @@ def create_sample_files(input_dir="../swap_implied_input"):
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment
     
+    # Header styles, built once and shared by every header cell
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+    header_align = Alignment(horizontal='center')
+    
     Path(input_dir).mkdir(parents=True, exist_ok=True)
     
     print(f"Creating sample master files in {input_dir}...")
@@ -612,9 +895,9 @@ def create_sample_files(input_dir="../swap_implied_input"):
         for col_num, header in enumerate(headers, 1):
             cell = sheet.cell(row=1, column=col_num)
             cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_align
         
         # Sample data
         sample_data = [
@@ -12,32 +12,178 @@ Usage:
 """
 
 import argparse
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 import os
+import random
+import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
+# Optional: download screenshots on one asyncio event loop when installed
+try:
+    import asyncio
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: orjson for encoding task payloads and decoding API responses,
+# else msgspec's C JSON decoder for the responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+    _JSON_DECODER = msgspec.json.Decoder()
+except ImportError:
+    _JSON_DECODER = None
+
+
+def pooled_session():
+    """
+    Create a requests session with a keep-alive connection pool.
+
+    Idempotent requests that fail with 429 or a 5xx status are retried with
+    exponential backoff; POSTs (task creation) are never retried.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Tenor in a pair name: "USDSGD 1M FWD" or "USD/SGD - 3 Months" (not "12M")
+TENOR_RE = re.compile(
+    r"(?P<m1>\b1\s*M(?:onth)?\b)|(?P<m3>\b3\s*M(?:onths?)?\b)|(?P<m6>\b6\s*M(?:onths?)?\b)",
+    re.IGNORECASE
+)
+GROUP_TO_TENOR = {"m1": "1M", "m3": "3M", "m6": "6M"}
+
+# "key = value" credential lines, skipping "#" comments
+CRED_RE = re.compile(r"^[ \t]*([^#=\n][^=\n]*)=(.*)$", re.MULTILINE)
+
+# Non-breaking spaces in scraped names -> plain spaces
+_NBSP_TABLE = str.maketrans({"\xa0": " "})
+
+# (connect, read) timeouts for screenshot downloads, and the copy buffer
+# size: 1 MiB covers most full-page PNGs in one or two reads
+DOWNLOAD_TIMEOUT = (5, 60)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+class _SafeNameTable(dict):
+    """str.translate table keeping alphanumerics and "._-", mapping the rest to "_"."""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in "._-" else ord("_")
+        self[codepoint] = value
+        return value
+
+
+# Filled in per character on first use
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
+def safe_filename(name):
+    """Replace every character of name that is not alphanumeric or "._-" with "_"."""
+    return name.translate(_SAFE_NAME_TABLE)
+
+
+def _decode_json(response):
+    """Decode a JSON response body, with orjson or msgspec when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    if _JSON_DECODER is not None:
+        return _JSON_DECODER.decode(response.content)
+    return response.json()
+
+
+# Task statuses that will not change on a later status check
+TERMINAL_STATUSES = frozenset(["successful", "failed"])
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "swapimplied" / "browse_ai"
+
+
+class TaskCache:
+    """
+    On-disk cache of successful task results.
+
+    Results are stored as {cache_dir}/{robot_id}/{task_id}.json and served
+    for up to ttl seconds, so re-running with --task-id skips the API.
+    In-progress and failed tasks are never cached.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=24 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, robot_id, task_id):
+        return self.cache_dir / robot_id / f"{task_id}.json"
+
+    def get(self, robot_id, task_id):
+        """Return the cached task dict, or None if missing or expired."""
+        path = self._path(robot_id, task_id)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, robot_id, task_id, task):
+        """Store a successful task; other statuses are ignored."""
+        if task.get("status") != "successful":
+            return
+        path = self._path(robot_id, task_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(task, f)
+        except OSError as e:
+            print(f"  Warning: Could not cache task {task_id}: {e}")
+
 
 class BrowseAIClient:
     """Client for interacting with Browse.AI API v2"""
 
     BASE_URL = "https://api.browse.ai/v2"
 
-    def __init__(self, api_key, robot_id):
+    def __init__(self, api_key, robot_id, cache=None, session=None):
         """
         Initialize the Browse.AI client.
 
         Args:
             api_key: Browse.AI API key (format: key_id:key_secret)
             robot_id: ID of the robot to run
+            cache: Optional TaskCache for successful task results
+            session: Optional requests session to share with other clients
         """
         self.api_key = api_key
         self.robot_id = robot_id
+        self.cache = cache
+        # Tasks already seen in a terminal status, by task ID
+        self._task_cache = {}
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        # One pooled session, so polling reuses the TLS connection. The API
+        # key goes in each request's headers, never the session's, so a
+        # shared session doesn't send it to other hosts
+        self.session = session if session is not None else pooled_session()
 
     def run_task(self, input_parameters=None):
         """
@@ -58,10 +204,15 @@ class BrowseAIClient:
         print(f"Triggering robot task...")
         print(f"  Robot ID: {self.robot_id}")
 
-        response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+        if orjson is not None:
+            # Content-Type: application/json is already in self.headers
+            response = self.session.post(url, data=orjson.dumps(payload),
+                                         headers=self.headers, timeout=30)
+        else:
+            response = self.session.post(url, json=payload, headers=self.headers, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
 
         if data.get("statusCode") == 200:
             result = data.get("result", {})
@@ -84,32 +235,57 @@ class BrowseAIClient:
         Returns:
             dict: Task details including status and captured data
         """
+        cached = self._task_cache.get(task_id)
+        if cached is not None:
+            return cached
+
+        if self.cache is not None:
+            cached = self.cache.get(self.robot_id, task_id)
+            if cached is not None:
+                self._task_cache[task_id] = cached
+                return cached
+
         url = f"{self.BASE_URL}/robots/{self.robot_id}/tasks/{task_id}"
 
-        response = requests.get(url, headers=self.headers, timeout=30)
+        response = self.session.get(url, headers=self.headers, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
 
         if data.get("statusCode") == 200:
-            return data.get("result", {})
+            task = data.get("result", {})
+            if task.get("status") in TERMINAL_STATUSES:
+                self._task_cache[task_id] = task
+            if self.cache is not None:
+                self.cache.set(self.robot_id, task_id, task)
+            return task
         else:
             raise Exception(f"Failed to get task status: {data}")
 
-    def wait_for_completion(self, task_id, poll_interval=5, max_wait=300):
+    def wait_for_completion(self, task_id, poll_interval=5, max_wait=300,
+                            max_poll_interval=30, poll_growth=1.5, wake_event=None):
         """
         Wait for a task to complete.
 
+        The delay between status checks starts at poll_interval and grows by
+        poll_growth per check up to max_poll_interval, with +/-20% jitter.
+
         Args:
             task_id: ID of the task to wait for
-            poll_interval: Seconds between status checks
+            poll_interval: Seconds before the second status check
             max_wait: Maximum seconds to wait
+            max_poll_interval: Upper bound on the delay between checks
+            poll_growth: Factor the delay grows by after each check
+            wake_event: Optional threading.Event; setting it (e.g. from a
+                webhook listener) cuts the current delay short and checks
+                the status at once
 
         Returns:
             dict: Completed task details
         """
         print(f"\nWaiting for task to complete...")
         start_time = time.time()
+        attempt = 0
 
         while True:
             elapsed = time.time() - start_time
@@ -129,36 +305,192 @@ class BrowseAIClient:
                 video_url = task.get("videoUrl", "")
                 raise Exception(f"Task failed: {error}\nDebug video: {video_url}")
 
-            time.sleep(poll_interval)
+            delay = min(max_poll_interval, poll_interval * poll_growth ** attempt)
+            delay *= random.uniform(0.8, 1.2)
+            # Never sleep past the max_wait budget
+            delay = max(0, min(delay, max_wait - (time.time() - start_time)))
+            if wake_event is None:
+                time.sleep(delay)
+            elif wake_event.wait(delay):
+                wake_event.clear()
+            attempt += 1
 
     def get_robot_info(self):
         """Get information about the robot."""
         url = f"{self.BASE_URL}/robots/{self.robot_id}"
 
-        response = requests.get(url, headers=self.headers, timeout=30)
+        response = self.session.get(url, headers=self.headers, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
         if data.get("statusCode") == 200:
             return data.get("robot", {})
         return None
 
 
-def download_screenshot(url, output_path):
+class DownloadIndex:
     """
-    Download a screenshot from a URL.
+    Sidecar file in the output directory recording, per screenshot URL, the
+    ETag / Last-Modified of the last download and where it was saved.
+
+    Re-downloads send these as If-None-Match / If-Modified-Since; on a 304
+    the previous file is copied locally instead of fetching the body again.
+    """
+
+    FILENAME = ".download_index.json"
+
+    def __init__(self, directory):
+        self.path = os.path.join(str(directory), self.FILENAME)
+        self.unchanged = set()
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def conditional_headers(self, url):
+        """Return (request headers, previous file path) for a URL, if still on disk."""
+        entry = self.entries.get(url)
+        if not entry or not os.path.exists(entry.get("path", "")):
+            return {}, None
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers, (entry["path"] if headers else None)
+
+    def reuse(self, url, previous_path, output_path):
+        """Handle a 304: copy the previous download to output_path."""
+        if os.path.abspath(previous_path) != os.path.abspath(output_path):
+            shutil.copyfile(previous_path, output_path)
+        with self._lock:
+            self.entries[url]["path"] = str(output_path)
+            self.unchanged.add(str(output_path))
+
+    def record(self, url, headers, output_path):
+        """Remember the validators from a 200 response."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._lock:
+                self.entries[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "path": str(output_path),
+                }
+
+    def save(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.entries, f, indent=2)
+        except OSError as e:
+            print(f"  Warning: Could not save {self.path}: {e}")
+
+
+def download_screenshot(url, output_path, session=None, quiet=False, index=None):
+    """
+    Download a screenshot from a URL, streaming it to disk.
 
     Args:
         url: URL of the screenshot
         output_path: Path to save the screenshot
+        session: Optional requests session to reuse across downloads
+        quiet: Do not print the saved path (for callers downloading in threads)
+        index: Optional DownloadIndex for conditional re-downloads
+
+    Returns:
+        The output path
     """
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
+    http = session or requests
+    headers, previous_path = index.conditional_headers(url) if index else ({}, None)
+    with http.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers) as response:
+        if response.status_code == 304 and previous_path:
+            index.reuse(url, previous_path, output_path)
+            if not quiet:
+                print(f"    Unchanged: {output_path}")
+            return output_path
+        response.raise_for_status()
+        response.raw.decode_content = True
+        # Copy socket -> output file directly; spooling to a temp file first
+        # (e.g. to os.sendfile it across) would add a pass, not save one
+        with open(output_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        if index:
+            index.record(url, response.headers, output_path)
+
+    if not quiet:
+        print(f"    Saved: {output_path}")
+    return output_path
+
+
+async def _download_screenshot_async(session, semaphore, url, output_path, index=None):
+    """Stream one screenshot to disk with aiohttp, at most semaphore-many at once."""
+    headers, previous_path = index.conditional_headers(url) if index else ({}, None)
+    async with semaphore:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and previous_path:
+                index.reuse(url, previous_path, output_path)
+                return output_path
+            response.raise_for_status()
+            with open(output_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            if index:
+                index.record(url, response.headers, output_path)
+    return output_path
+
+
+async def _download_screenshots_async(jobs, concurrency, index=None):
+    """aiohttp implementation of download_screenshots."""
+    connect_timeout, read_timeout = DOWNLOAD_TIMEOUT
+    timeout = aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        results = await asyncio.gather(
+            *(_download_screenshot_async(session, semaphore, url, path, index)
+              for url, path, _ in jobs),
+            return_exceptions=True
+        )
+    return [(label, result) for (_, _, label), result in zip(jobs, results)]
 
-    with open(output_path, 'wb') as f:
-        f.write(response.content)
 
-    print(f"    Saved: {output_path}")
+def download_screenshots(jobs, concurrency=8, index=None, session=None):
+    """
+    Download screenshots concurrently.
+
+    Uses aiohttp when installed, otherwise a thread pool sharing one pooled
+    requests session.
+
+    Args:
+        jobs: List of (url, output_path, label) tuples
+        concurrency: Maximum downloads in flight
+        index: Optional DownloadIndex for conditional re-downloads
+        session: Optional requests session for the thread pool to reuse
+
+    Returns:
+        list: (label, saved path or the exception raised) in job order
+    """
+    if aiohttp is not None:
+        return asyncio.run(_download_screenshots_async(jobs, concurrency, index))
+
+    if session is None:
+        session = pooled_session()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(download_screenshot, url, path, session, quiet=True, index=index)
+            for url, path, _ in jobs
+        ]
+
+    results = []
+    for (_, _, label), future in zip(jobs, futures):
+        try:
+            results.append((label, future.result()))
+        except Exception as e:
+            results.append((label, e))
+    return results
 
 
 def parse_forward_points_from_table(task):
@@ -173,37 +505,39 @@ def parse_forward_points_from_table(task):
     """
     captured_lists = task.get("capturedLists", {})
 
-    # capturedLists is a dict of list_name -> list of row dicts
-    rows = []
-    for list_name, list_rows in captured_lists.items():
-        if isinstance(list_rows, list):
-            rows.extend(list_rows)
+    # capturedLists is a dict of list_name -> list of row dicts; iterate
+    # the lists in place rather than copying them into one list
+    row_lists = [
+        list_rows for list_rows in captured_lists.values()
+        if isinstance(list_rows, list) and list_rows
+    ]
 
-    if not rows:
+    if not row_lists:
         print("  No table data found in capturedLists.")
         return {}
 
-    # Match both "USDSGD 1M FWD" style and "USD/SGD - 1 Month" style names
-    tenor_patterns = {
-        "1M": ["1M", "1 Month"],
-        "3M": ["3M", "3 Months"],
-        "6M": ["6M", "6 Months"],
-    }
     results = {}
 
-    for row in rows:
+    for row in chain.from_iterable(row_lists):
         # Column is "Pair Name" (not "Name"); normalize non-breaking spaces
-        name = row.get("Pair Name", row.get("Name", "")).replace("\xa0", " ")
-        for tenor, patterns in tenor_patterns.items():
-            if any(p in name for p in patterns):
-                try:
-                    bid = float(row.get("Bid", "").replace(",", ""))
-                    ask = float(row.get("Ask", "").replace(",", ""))
-                    mid = (bid + ask) / 2.0
-                    results[tenor] = {"bid": bid, "ask": ask, "mid": mid}
-                except (ValueError, TypeError) as e:
-                    print(f"  Warning: Could not parse bid/ask for {tenor}: {e}")
-                break
+        name = row.get("Pair Name", row.get("Name", "")).translate(_NBSP_TABLE)
+        match = TENOR_RE.search(name)
+        if not match:
+            continue
+
+        tenor = GROUP_TO_TENOR[match.lastgroup]
+        bid_text = (row.get("Bid") or "").replace(",", "")
+        ask_text = (row.get("Ask") or "").replace(",", "")
+        if not bid_text or not ask_text:
+            print(f"  Warning: Missing bid/ask for {tenor}")
+            continue
+        try:
+            bid = float(bid_text)
+            ask = float(ask_text)
+        except ValueError as e:
+            print(f"  Warning: Could not parse bid/ask for {tenor}: {e}")
+            continue
+        results[tenor] = {"bid": bid, "ask": ask, "mid": (bid + ask) / 2.0}
 
     return results
 
@@ -218,16 +552,19 @@ def load_credentials(credentials_file):
     Returns:
         tuple: (api_key, workspace_id, robot_id, screenshot_robot_id)
     """
-    credentials = {}
+    return _load_credentials(str(Path(credentials_file).resolve()))
 
-    with open(credentials_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if '=' in line and not line.startswith('#'):
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip().strip("'\"")
-                credentials[key] = value
+
+@lru_cache(maxsize=4)
+def _load_credentials(credentials_path):
+    """load_credentials for a resolved path, read once per process."""
+    with open(credentials_path, 'r') as f:
+        text = f.read()
+
+    credentials = {
+        key.strip(): value.strip().strip("'\"")
+        for key, value in CRED_RE.findall(text)
+    }
 
     api_key = credentials.get('browse_ai_api')
     workspace_id = credentials.get('workspace_id')
@@ -274,7 +611,35 @@ def main():
         '--poll-interval',
         type=int,
         default=5,
-        help='Seconds between status checks (default: 5)'
+        help='Initial seconds between status checks (default: 5)'
+    )
+    parser.add_argument(
+        '--max-poll-interval',
+        type=int,
+        default=30,
+        help='Maximum seconds between status checks (default: 30)'
+    )
+    parser.add_argument(
+        '--poll-growth',
+        type=float,
+        default=1.5,
+        help='Factor the poll interval grows by after each check (default: 1.5)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=str(DEFAULT_CACHE_DIR),
+        help=f'Directory for cached task results (default: {DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always fetch task results from the API'
+    )
+    parser.add_argument(
+        '--download-concurrency',
+        type=int,
+        default=8,
+        help='Maximum screenshots downloaded at once (default: 8)'
     )
 
     args = parser.parse_args()
@@ -298,7 +663,8 @@ def main():
     print()
 
     # Initialize client
-    client = BrowseAIClient(api_key, robot_id)
+    cache = None if args.no_cache else TaskCache(args.cache_dir)
+    client = BrowseAIClient(api_key, robot_id, cache=cache)
 
     # Get robot info
     print("Fetching robot information...")
@@ -328,7 +694,9 @@ def main():
         task = client.wait_for_completion(
             task_id,
             poll_interval=args.poll_interval,
-            max_wait=args.max_wait
+            max_wait=args.max_wait,
+            max_poll_interval=args.max_poll_interval,
+            poll_growth=args.poll_growth
         )
 
     # Process results
@@ -352,8 +720,11 @@ def main():
         # Create output directory
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        # Output paths are plain strings joined onto this
+        out_str = str(output_dir)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Every file from this run shares the timestamp prefix
+        prefix = datetime.now().strftime("%Y%m%d_%H%M%S") + "_"
 
         # Handle both dict format (name -> screenshot_data) and list format
         if isinstance(captured_screenshots, dict):
@@ -364,32 +735,36 @@ def main():
         else:
             screenshots_list = captured_screenshots
 
+        # Collect (url, output_path, label) for every screenshot and diff image
+        jobs = []
         for screenshot in screenshots_list:
             name = screenshot.get("name", "screenshot")
             url = screenshot.get("src") or screenshot.get("url")
 
             if url:
                 # Create filename with timestamp
-                safe_name = "".join(c if c.isalnum() or c in "._-" else "_" for c in name)
-                filename = f"{timestamp}_{safe_name}.png"
-                output_path = output_dir / filename
-
-                print(f"  Downloading: {name}")
-                try:
-                    download_screenshot(url, output_path)
-                except Exception as e:
-                    print(f"    Error: {e}")
+                safe_name = safe_filename(name)
+                filename = prefix + safe_name + ".png"
+                jobs.append((url, os.path.join(out_str, filename), name))
 
                 # Also download diff image if available
                 diff_url = screenshot.get("diffImageSrc")
                 if diff_url:
-                    diff_filename = f"{timestamp}_{safe_name}_diff.png"
-                    diff_path = output_dir / diff_filename
-                    print(f"  Downloading diff: {name}")
-                    try:
-                        download_screenshot(diff_url, diff_path)
-                    except Exception as e:
-                        print(f"    Error downloading diff: {e}")
+                    diff_filename = prefix + safe_name + "_diff.png"
+                    jobs.append((diff_url, os.path.join(out_str, diff_filename), f"diff: {name}"))
+
+        # Downloads are independent: run them concurrently
+        for _, _, label in jobs:
+            print(f"  Downloading: {label}")
+        index = DownloadIndex(out_str)
+        for label, result in download_screenshots(jobs, args.download_concurrency, index):
+            if isinstance(result, Exception):
+                print(f"    Error downloading {label}: {result}")
+            elif result in index.unchanged:
+                print(f"    Unchanged: {result}")
+            else:
+                print(f"    Saved: {result}")
+        index.save()
     else:
         print("\nNo screenshots captured.")
 
@@ -8,6 +8,30 @@ from datetime import datetime
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
+# Cell styles, built once and shared by every cell that uses them
+TITLE_FONT = Font(size=14, bold=True)
+SUBTITLE_FONT = Font(size=10, italic=True, color='666666')
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=11)
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+HEADER_BORDER = Border(
+    left=Side(style='thin', color='FFFFFF'),
+    right=Side(style='thin', color='FFFFFF'),
+    top=Side(style='thin', color='FFFFFF'),
+    bottom=Side(style='thin', color='FFFFFF')
+)
+DATA_BORDER = Border(
+    left=Side(style='thin', color='CCCCCC'),
+    right=Side(style='thin', color='CCCCCC'),
+    top=Side(style='thin', color='CCCCCC'),
+    bottom=Side(style='thin', color='CCCCCC')
+)
+CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+TITLE_ALIGN = Alignment(horizontal='center')
+ALT_FILL = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+PERIOD_FONT = Font(bold=True, size=10)
+NOTE_FONT = Font(size=9, italic=True, color='666666')
+WARNING_FONT = Font(size=9, bold=True, italic=True, color='FF0000')
+
 def create_sample_excel():
     """Create sample Excel file with demo data"""
     
@@ -48,14 +72,14 @@ def create_sample_excel():
     
     # Title
     sheet['A1'] = 'USD/SGD Forward Points'
-    sheet['A1'].font = Font(size=14, bold=True)
+    sheet['A1'].font = TITLE_FONT
     sheet.merge_cells('A1:G1')
-    sheet['A1'].alignment = Alignment(horizontal='center')
+    sheet['A1'].alignment = TITLE_ALIGN
     
     sheet['A2'] = f'Sample Data - Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
-    sheet['A2'].font = Font(size=10, italic=True, color='666666')
+    sheet['A2'].font = SUBTITLE_FONT
     sheet.merge_cells('A2:G2')
-    sheet['A2'].alignment = Alignment(horizontal='center')
+    sheet['A2'].alignment = TITLE_ALIGN
     
     # Headers
     headers = ['Period', 'Bid', 'Ask', 'High', 'Low', 'Change', 'Time']
@@ -64,41 +88,27 @@ def create_sample_excel():
     for col_num, header in enumerate(headers, 1):
         cell = sheet.cell(row=header_row, column=col_num)
         cell.value = header
-        cell.font = Font(bold=True, color='FFFFFF', size=11)
-        cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        thin_border = Border(
-            left=Side(style='thin', color='FFFFFF'),
-            right=Side(style='thin', color='FFFFFF'),
-            top=Side(style='thin', color='FFFFFF'),
-            bottom=Side(style='thin', color='FFFFFF')
-        )
-        cell.border = thin_border
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = HEADER_BORDER
     
     # Data rows
     for row_num, record in enumerate(sample_data, header_row + 1):
         for col_num, header in enumerate(headers, 1):
             cell = sheet.cell(row=row_num, column=col_num)
             cell.value = record[header]
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+            cell.alignment = CENTER_ALIGN
             
             # Alternating row colors
             if row_num % 2 == 0:
-                cell.fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+                cell.fill = ALT_FILL
             
-            # Border
-            thin_border = Border(
-                left=Side(style='thin', color='CCCCCC'),
-                right=Side(style='thin', color='CCCCCC'),
-                top=Side(style='thin', color='CCCCCC'),
-                bottom=Side(style='thin', color='CCCCCC')
-            )
-            cell.border = thin_border
+            cell.border = DATA_BORDER
             
             # Bold period names
             if col_num == 1:
-                cell.font = Font(bold=True, size=10)
+                cell.font = PERIOD_FONT
     
     # Column widths
     column_widths = {
@@ -117,13 +127,13 @@ def create_sample_excel():
     # Notes
     note_row = header_row + len(sample_data) + 2
     sheet[f'A{note_row}'] = 'Note: Forward points are in pips. Negative values indicate forward discount.'
-    sheet[f'A{note_row}'].font = Font(size=9, italic=True, color='666666')
+    sheet[f'A{note_row}'].font = NOTE_FONT
     
     sheet[f'A{note_row + 1}'] = 'Source: Investing.com (https://www.investing.com/currencies/usd-sgd-forward-rates)'
-    sheet[f'A{note_row + 1}'].font = Font(size=9, italic=True, color='666666')
+    sheet[f'A{note_row + 1}'].font = NOTE_FONT
     
     sheet[f'A{note_row + 2}'] = 'This is SAMPLE DATA for demonstration purposes only.'
-    sheet[f'A{note_row + 2}'].font = Font(size=9, bold=True, italic=True, color='FF0000')
+    sheet[f'A{note_row + 2}'].font = WARNING_FONT
     
     # Freeze panes
     sheet.freeze_panes = f'A{header_row + 1}'
@@ -14,90 +14,236 @@ Usage:
     python extract_forward_points.py --browse-ai    # full pipeline via Browse.AI
 """
 
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from importlib.util import find_spec
+import atexit
 import sys
 import os
+import re
+import json
 import argparse
-import pandas as pd
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# pandas, numpy, openpyxl, BeautifulSoup and the update/calculation modules
+# are imported inside the functions that use them, so --help and the plain
+# requests mode do not pay for loading them
+
+# Optional: selectolax's Lexbor parser is much lighter than a BeautifulSoup tree
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional: xlsxwriter streams rows to disk and reuses format objects,
+# much faster than building openpyxl cell objects
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Optional: pyarrow for a Parquet copy of each implied-rate output, which
+# loads far faster than the xlsx (only looked up here; pandas imports it)
+HAVE_PYARROW = find_spec('pyarrow') is not None
+
 # Add parent directory to path for cross-module imports
-_project_root = Path(__file__).resolve().parent.parent
+_script_dir = Path(__file__).resolve().parent
+_project_root = _script_dir.parent
 sys.path.insert(0, str(_project_root / 'extract_fwd_points'))
 sys.path.insert(0, str(_project_root / 'extract_all_rates'))
 sys.path.insert(0, str(_project_root / 'calc_swap_implied'))
 
-from browse_ai_extractor import BrowseAIClient, load_credentials
-from update_swap_implied_data import DataExtractor, DataUpdater
-from calculate_swap_implied_rates import HolidayCalendar, SwapImpliedRateCalculator, find_sofr_column
+from browse_ai_extractor import BrowseAIClient, load_credentials, pooled_session
+
+# Default master file (input) and implied-rate output locations
+DEFAULT_INPUT_DIR = _project_root / 'swap_implied_input'
+DEFAULT_OUTPUT_DIR = _project_root
+
+FORWARD_POINTS_URL = "https://www.investing.com/currencies/usd-sgd-forward-rates"
+
+# Forward pair names on investing.com and in Browse.AI captured rows,
+# e.g. "USDSGD 3M FWD"; the group is the tenor in months
+_FORWARD_PAIR_RE = re.compile(r'USDSGD ([136])M FWD')
+_PERIOD_NAMES = {'1': '1-Month', '3': '3-Month', '6': '6-Month'}
+
+# Keep-alive connection pool shared by investing.com and the DataExtractor
+# SOFR/FX requests, so repeated calls skip the TCP/TLS handshake
+_SESSION = pooled_session()
+
+# DataExtractor shared by every stage of a run (see get_extractor)
+_EXTRACTOR = None
+
+
+def get_extractor(use_selenium=False):
+    """
+    Shared DataExtractor on _SESSION, created on first use.
+
+    Later stages reuse it, so a Selenium browser started for the forward
+    points also serves the SOFR/FX fetches. Asking for Selenium when the
+    shared extractor uses requests replaces it. Closed at interpreter exit.
+    """
+    global _EXTRACTOR
+    if _EXTRACTOR is None or (use_selenium and not _EXTRACTOR.use_selenium):
+        from update_swap_implied_data import DataExtractor
+
+        if _EXTRACTOR is not None:
+            _EXTRACTOR.close()
+        _EXTRACTOR = DataExtractor(use_selenium=use_selenium, session=_SESSION)
+        atexit.register(_EXTRACTOR.close)
+    return _EXTRACTOR
+
+
+def _lexbor_text(node):
+    return node.text(strip=True)
+
+
+def _bs4_text(tag):
+    return tag.get_text(strip=True)
+
+
+def _first_table_rows(content):
+    """
+    Parse a page (decoded HTML text) and return the <td> cells of each row
+    of its first table, plus a function reading a cell's stripped text;
+    (None, None) if the page has no table. Uses selectolax when installed,
+    else BeautifulSoup.
+    """
+    if LexborHTMLParser is not None:
+        table = LexborHTMLParser(content).css_first('table')
+        if table is None:
+            return None, None
+        return [row.css('td') for row in table.css('tr')], _lexbor_text
+
+    from bs4 import BeautifulSoup
+    from update_swap_implied_data import HTML_PARSER
+
+    # lxml when installed, else html.parser (see update_swap_implied_data)
+    soup = BeautifulSoup(content, HTML_PARSER)
+    table = soup.find('table')
+    if table is None:
+        return None, None
+    return [row.find_all('td') for row in table.find_all('tr')], _bs4_text
 
 
 def extract_forward_points():
     """Extract forward points from Investing.com"""
-    url = "https://www.investing.com/currencies/usd-sgd-forward-rates"
+    url = FORWARD_POINTS_URL
 
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, headers=headers, timeout=10)
         response.raise_for_status()
     except Exception as e:
         print(f"Error fetching data: {e}")
         return None
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    # investing.com serves UTF-8: decode it directly rather than having the
+    # parser sniff the encoding of the raw bytes
+    response.encoding = 'utf-8'
 
     # Find the forward rates table
-    table = soup.find('table')
-    if not table:
+    rows, cell_text = _first_table_rows(response.text)
+    if rows is None:
         print("Error: Forward rates table not found")
         return None
 
-    # Extract data for 1M, 3M, and 6M
-    target_periods = {
-        'USDSGD 1M FWD': '1-Month',
-        'USDSGD 3M FWD': '3-Month',
-        'USDSGD 6M FWD': '6-Month'
-    }
-
+    # Extract data for 1M, 3M, and 6M; other rows are skipped on the name
+    # cell alone, without reading the rest of their cells
     results = []
-    rows = table.find_all('tr')
 
-    for row in rows:
-        cells = row.find_all('td')
+    for cells in rows:
         if len(cells) >= 7:
-            name_cell = cells[0].get_text(strip=True)
-
-            for target_name, display_name in target_periods.items():
-                if target_name in name_cell:
-                    try:
-                        bid = cells[1].get_text(strip=True)
-                        ask = cells[2].get_text(strip=True)
-                        high = cells[3].get_text(strip=True)
-                        low = cells[4].get_text(strip=True)
-                        change = cells[5].get_text(strip=True)
-                        time = cells[6].get_text(strip=True)
-
-                        results.append({
-                            'Period': display_name,
-                            'Bid': bid,
-                            'Ask': ask,
-                            'High': high,
-                            'Low': low,
-                            'Change': change,
-                            'Time': time
-                        })
-                    except Exception as e:
-                        print(f"Error parsing {display_name}: {e}")
+            match = _FORWARD_PAIR_RE.search(cell_text(cells[0]))
+            if not match:
+                continue
+            display_name = _PERIOD_NAMES[match.group(1)]
+
+            try:
+                bid = cell_text(cells[1])
+                ask = cell_text(cells[2])
+                high = cell_text(cells[3])
+                low = cell_text(cells[4])
+                change = cell_text(cells[5])
+                time = cell_text(cells[6])
+
+                results.append({
+                    'Period': display_name,
+                    'Bid': bid,
+                    'Ask': ask,
+                    'High': high,
+                    'Low': low,
+                    'Change': change,
+                    'Time': time
+                })
+            except Exception as e:
+                print(f"Error parsing {display_name}: {e}")
 
     return results
 
+FORWARD_POINTS_HEADERS = ['Period', 'Bid', 'Ask', 'High', 'Low', 'Change', 'Time']
+FORWARD_POINTS_NOTE = 'Note: Forward points are in pips. Negative values indicate forward discount.'
+FORWARD_POINTS_SOURCE = f'Source: Investing.com ({FORWARD_POINTS_URL})'
+
+@lru_cache(maxsize=None)
+def _openpyxl_styles():
+    """openpyxl cell styles for create_excel, built once and shared by every cell"""
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+    thin = Side(style='thin')
+    return {
+        'title_font': Font(size=14, bold=True),
+        'subtitle_font': Font(size=10, italic=True),
+        'header_font': Font(bold=True, color='FFFFFF'),
+        'header_fill': PatternFill(start_color='366092', end_color='366092', fill_type='solid'),
+        'thin_border': Border(left=thin, right=thin, top=thin, bottom=thin),
+        'center_align': Alignment(horizontal='center', vertical='center'),
+        'period_font': Font(bold=True),
+        'note_font': Font(size=9, italic=True),
+    }
+
+
+def _create_excel_xlsxwriter(data, filename):
+    """create_excel layout written with xlsxwriter in constant_memory mode"""
+    wb = xlsxwriter.Workbook(filename, {'constant_memory': True})
+    sheet = wb.add_worksheet('Forward Points')
+
+    # Formats are created once and shared by every cell
+    title_fmt = wb.add_format({'bold': True, 'font_size': 14})
+    subtitle_fmt = wb.add_format({'italic': True, 'font_size': 10})
+    header_fmt = wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+                                'align': 'center', 'valign': 'vcenter', 'border': 1})
+    body_fmt = wb.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1})
+    period_fmt = wb.add_format({'bold': True, 'align': 'center', 'valign': 'vcenter', 'border': 1})
+    note_fmt = wb.add_format({'italic': True, 'font_size': 9})
+
+    # Column widths (A and G wider for period names and times)
+    sheet.set_column('A:A', 15)
+    sheet.set_column('B:F', 12)
+    sheet.set_column('G:G', 15)
+
+    # constant_memory flushes each row once a later row is started,
+    # so everything is written strictly top to bottom
+    sheet.write(0, 0, 'USD/SGD Forward Points', title_fmt)
+    sheet.write(1, 0, f'Extracted: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', subtitle_fmt)
+
+    header_row = 3
+    sheet.write_row(header_row, 0, FORWARD_POINTS_HEADERS, header_fmt)
+    for row_num, record in enumerate(data, header_row + 1):
+        sheet.write(row_num, 0, record['Period'], period_fmt)
+        sheet.write_row(row_num, 1, [record[h] for h in FORWARD_POINTS_HEADERS[1:]], body_fmt)
+
+    note_row = header_row + len(data) + 2
+    sheet.write(note_row, 0, FORWARD_POINTS_NOTE, note_fmt)
+    sheet.write(note_row + 1, 0, FORWARD_POINTS_SOURCE, note_fmt)
+
+    wb.close()
+
+
 def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
     """Create formatted Excel file with forward points data"""
 
@@ -105,55 +251,51 @@ def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
         print("No data to save")
         return False
 
+    if xlsxwriter is not None:
+        try:
+            _create_excel_xlsxwriter(data, filename)
+            print(f"Data successfully saved to {filename}")
+            return True
+        except Exception as e:
+            print(f"Error saving Excel file: {e}")
+            return False
+
+    from openpyxl import Workbook
+
+    styles = _openpyxl_styles()
     wb = Workbook()
     sheet = wb.active
     sheet.title = 'Forward Points'
 
     # Title
     sheet['A1'] = 'USD/SGD Forward Points'
-    sheet['A1'].font = Font(size=14, bold=True)
+    sheet['A1'].font = styles['title_font']
     sheet['A2'] = f'Extracted: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
-    sheet['A2'].font = Font(size=10, italic=True)
+    sheet['A2'].font = styles['subtitle_font']
 
     # Headers
-    headers = ['Period', 'Bid', 'Ask', 'High', 'Low', 'Change', 'Time']
+    headers = FORWARD_POINTS_HEADERS
     header_row = 4
 
     for col_num, header in enumerate(headers, 1):
         cell = sheet.cell(row=header_row, column=col_num)
         cell.value = header
-        cell.font = Font(bold=True, color='FFFFFF')
-        cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Border
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        cell.border = thin_border
+        cell.font = styles['header_font']
+        cell.fill = styles['header_fill']
+        cell.alignment = styles['center_align']
+        cell.border = styles['thin_border']
 
     # Data rows
     for row_num, record in enumerate(data, header_row + 1):
         for col_num, header in enumerate(headers, 1):
             cell = sheet.cell(row=row_num, column=col_num)
             cell.value = record[header]
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # Border
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            cell.border = thin_border
+            cell.alignment = styles['center_align']
+            cell.border = styles['thin_border']
 
             # Highlight period names
             if col_num == 1:
-                cell.font = Font(bold=True)
+                cell.font = styles['period_font']
 
     # Column widths
     column_widths = {
@@ -171,11 +313,11 @@ def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
 
     # Note
     note_row = header_row + len(data) + 2
-    sheet[f'A{note_row}'] = 'Note: Forward points are in pips. Negative values indicate forward discount.'
-    sheet[f'A{note_row}'].font = Font(size=9, italic=True)
+    sheet[f'A{note_row}'] = FORWARD_POINTS_NOTE
+    sheet[f'A{note_row}'].font = styles['note_font']
 
-    sheet[f'A{note_row + 1}'] = 'Source: Investing.com (https://www.investing.com/currencies/usd-sgd-forward-rates)'
-    sheet[f'A{note_row + 1}'].font = Font(size=9, italic=True)
+    sheet[f'A{note_row + 1}'] = FORWARD_POINTS_SOURCE
+    sheet[f'A{note_row + 1}'].font = styles['note_font']
 
     try:
         wb.save(filename)
@@ -186,7 +328,88 @@ def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
         return False
 
 
-def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5):
+DEFAULT_EXTRACTION_CACHE_DIR = Path.home() / ".cache" / "swapimplied" / "extractions"
+
+
+def trading_date(day=None):
+    """Latest USD/SGD business day on or before day (default: today)"""
+    from calculate_swap_implied_rates import get_holiday_calendar
+
+    day = day or date.today()
+    calendar = get_holiday_calendar(year=day.year)
+    while not calendar.is_business_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+class ExtractionCache:
+    """
+    On-disk cache of extracted market data, one directory per trading date.
+
+    Values are stored as {cache_dir}/{YYYY-MM-DD}/{name}.json for the
+    latest business day, so re-running the pipeline on the same day (or
+    over a weekend/holiday) reuses the SOFR, FX and forward points already
+    scraped; the first run on the next business day fetches fresh values.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_EXTRACTION_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, name):
+        return self.cache_dir / trading_date().isoformat() / f"{name}.json"
+
+    def get(self, name):
+        """Return the cached value for today's trading date, or None."""
+        try:
+            with open(self._path(name), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, name, value):
+        """Store a value; written to a temp file and renamed into place."""
+        path = self._path(name)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  Warning: Could not cache {name}: {e}")
+
+
+# Common column names for the instrument name, in order of preference
+_BROWSE_AI_NAME_KEYS = ("Name", "name", "Instrument", "instrument", "Contract", "contract")
+
+
+def _browse_ai_list_keys(row):
+    """
+    (name_key, bid_key, ask_key) columns of a captured list, from one of its
+    rows; a key is None when the row has no such column
+    """
+    name_key = next((key for key in _BROWSE_AI_NAME_KEYS if key in row), None)
+    lower_keys = [(key, key.lower()) for key in row]
+    bid_key = next((key for key, lower in lower_keys if 'bid' in lower), None)
+    ask_key = next((key for key, lower in lower_keys if 'ask' in lower and 'bid' not in lower), None)
+    return name_key, bid_key, ask_key
+
+
+def _parse_quote(value):
+    """Captured bid/ask text as a float (thousands separators removed), or None"""
+    if isinstance(value, str):
+        try:
+            return float(value.replace(',', ''))
+        except ValueError:
+            return None
+    # Numbers pass straight through; None and anything else is not a quote
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5,
+                           initial_interval=0.5, poll_growth=1.5, cache=None):
     """
     Extract forward points via Browse.AI robot.
 
@@ -196,7 +419,11 @@ def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5):
     Args:
         credentials_path: Path to Browse_AI credentials file
         max_wait: Maximum seconds to wait for task completion
-        poll_interval: Seconds between status checks
+        poll_interval: Maximum seconds between status checks
+        initial_interval: Seconds before the second status check
+        poll_growth: Factor the delay between checks grows by, up to poll_interval
+        cache: Optional ExtractionCache; a hit for today's trading date
+               skips the Browse.AI run
 
     Returns:
         dict: {'1M': mid_1m, '3M': mid_3m, '6M': mid_6m} or None on failure
@@ -206,13 +433,19 @@ def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5):
     print("=" * 70)
     print()
 
+    if cache is not None:
+        forward_points = cache.get('forward_points')
+        if forward_points:
+            print(f"Using cached forward points for {trading_date()}: {forward_points}")
+            return forward_points
+
     # Load credentials
     creds_path = Path(credentials_path)
     if not creds_path.is_absolute():
-        creds_path = Path(__file__).parent / creds_path
+        creds_path = _script_dir / creds_path
 
     print(f"Loading credentials from: {creds_path}")
-    api_key, workspace_id, robot_id = load_credentials(creds_path)
+    api_key, workspace_id, robot_id, _ = load_credentials(creds_path)
     print(f"  Robot ID: {robot_id}")
     print()
 
@@ -223,11 +456,15 @@ def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5):
     task_result = client.run_task()
     task_id = task_result.get("id")
 
+    # Poll quickly at first so short tasks are picked up within a second,
+    # backing off to poll_interval for long ones
     print("-" * 70)
     task = client.wait_for_completion(
         task_id,
-        poll_interval=poll_interval,
-        max_wait=max_wait
+        poll_interval=min(initial_interval, poll_interval),
+        max_wait=max_wait,
+        max_poll_interval=poll_interval,
+        poll_growth=poll_growth
     )
 
     # Parse capturedLists for forward points
@@ -246,13 +483,6 @@ def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5):
             print(f"  capturedTexts: {captured_texts}")
         return None
 
-    # Target tenor names in the captured data
-    tenor_names = {
-        'USDSGD 1M FWD': '1M',
-        'USDSGD 3M FWD': '3M',
-        'USDSGD 6M FWD': '6M',
-    }
-
     forward_points = {}
 
     # capturedLists is typically a dict of list_name -> list of row dicts
@@ -261,68 +491,62 @@ def extract_with_browse_ai(credentials_path, max_wait=300, poll_interval=5):
         if not isinstance(rows, list):
             print(f"    Skipping (not a list): {type(rows)}")
             continue
+        if not rows:
+            continue
+
+        # Rows of one list share their columns: pick the instrument name,
+        # bid and ask columns once from the first row
+        name_key, bid_key, ask_key = _browse_ai_list_keys(rows[0])
 
         for row in rows:
-            # Row is a dict with column names as keys
-            row_name = ""
-            # Try common column names for the instrument name
-            for name_key in ["Name", "name", "Instrument", "instrument", "Contract", "contract"]:
-                if name_key in row:
-                    row_name = str(row[name_key]).strip()
-                    break
-
-            # If no named column, check first value
-            if not row_name and isinstance(row, dict):
-                first_val = next(iter(row.values()), "")
-                row_name = str(first_val).strip()
-
-            for target_name, tenor in tenor_names.items():
-                if target_name in row_name:
-                    # Extract Bid and Ask
-                    bid = None
-                    ask = None
-                    for key, val in row.items():
-                        key_lower = key.lower()
-                        if 'bid' in key_lower:
-                            try:
-                                bid = float(str(val).replace(',', ''))
-                            except (ValueError, TypeError):
-                                pass
-                        elif 'ask' in key_lower:
-                            try:
-                                ask = float(str(val).replace(',', ''))
-                            except (ValueError, TypeError):
-                                pass
+            # Row is a dict with column names as keys; with no named
+            # instrument column, the first value is the name
+            if name_key is not None:
+                row_name = str(row.get(name_key, "")).strip()
+            else:
+                row_name = str(next(iter(row.values()), "")).strip()
 
-                    if bid is not None and ask is not None:
-                        mid = round((bid + ask) / 2, 4)
-                        forward_points[tenor] = mid
-                        print(f"    {tenor}: Bid={bid}, Ask={ask}, Mid={mid}")
-                    else:
-                        print(f"    {tenor}: Could not parse Bid/Ask (bid={bid}, ask={ask})")
-                        print(f"    Row data: {row}")
+            match = _FORWARD_PAIR_RE.search(row_name)
+            if not match:
+                continue
+            tenor = match.group(1) + 'M'
+
+            # Extract Bid and Ask
+            bid = _parse_quote(row.get(bid_key)) if bid_key is not None else None
+            ask = _parse_quote(row.get(ask_key)) if ask_key is not None else None
+
+            if bid is not None and ask is not None:
+                mid = round((bid + ask) / 2, 4)
+                forward_points[tenor] = mid
+                print(f"    {tenor}: Bid={bid}, Ask={ask}, Mid={mid}")
+            else:
+                print(f"    {tenor}: Could not parse Bid/Ask (bid={bid}, ask={ask})")
+                print(f"    Row data: {row}")
 
     if len(forward_points) == 3:
         print(f"\nForward points extracted: 1M={forward_points['1M']}, 3M={forward_points['3M']}, 6M={forward_points['6M']}")
+        if cache is not None:
+            cache.set('forward_points', forward_points)
         return forward_points
     else:
         print(f"\nCould not extract all forward points. Found: {list(forward_points.keys())}")
         return None
 
 
-def update_master_files(forward_points, input_dir=None):
+def update_master_files(forward_points, input_dir=None, cache=None):
     """
     Extract SOFR rates and FX spot, then append today's data to master files.
 
     Args:
         forward_points: dict with keys '1M', '3M', '6M'
         input_dir: path to directory containing input_master_*.xlsx files
+        cache: Optional ExtractionCache for today's SOFR rates and FX spot
 
     Returns:
         tuple: (sofr_rates, fx_rate, update_results) or (None, None, None) on failure
     """
     if input_dir is None:
-        input_dir = str(Path(__file__).parent.parent / 'swap_implied_input')
+        input_dir = DEFAULT_INPUT_DIR
 
     print()
     print("=" * 70)
@@ -330,16 +554,32 @@ def update_master_files(forward_points, input_dir=None):
     print("=" * 70)
     print()
 
-    # Extract SOFR rates and FX spot using existing DataExtractor
-    extractor = DataExtractor(use_selenium=False)
-    sofr_rates = extractor.extract_sofr_rates()
-    fx_rate = extractor.extract_usdsgd_fx()
+    # Extract SOFR rates and FX spot using existing DataExtractor,
+    # unless already extracted for today's trading date
+    sofr_rates = cache.get('sofr') if cache is not None else None
+    fx_rate = cache.get('fx') if cache is not None else None
+    if sofr_rates and fx_rate:
+        print(f"Using cached SOFR rates and FX spot for {trading_date()}")
+    else:
+        extractor = get_extractor()
+        # Both pages are needed: fetch them concurrently on the shared
+        # session, then extract from the stored responses as usual
+        if not sofr_rates and not fx_rate and not extractor.use_selenium:
+            extractor.prefetch(include_forward_points=False)
+        sofr_rates = sofr_rates or extractor.extract_sofr_rates()
+        fx_rate = fx_rate or extractor.extract_usdsgd_fx()
+        if cache is not None:
+            if sofr_rates:
+                cache.set('sofr', sofr_rates)
+            if fx_rate:
+                cache.set('fx', fx_rate)
 
     if not sofr_rates or not fx_rate:
         print("Failed to extract SOFR rates or FX rate")
         return None, None, None
 
     # Update master files
+    from update_swap_implied_data import DataUpdater
     updater = DataUpdater(input_dir=input_dir)
     if not updater.validate_files():
         print(f"Master files not found in {input_dir}")
@@ -358,23 +598,192 @@ def update_master_files(forward_points, input_dir=None):
     return sofr_rates, fx_rate, results
 
 
-def calculate_implied_rates(input_dir=None, output_dir=None):
+# Master file column names for the FX spot and forward points
+_FX_COLUMN_RE = re.compile(r'USDSGD|FX', re.IGNORECASE)
+_FWD_COLUMN_RE = re.compile(r'FORWARD', re.IGNORECASE)
+
+
+def find_master_columns(columns, tenor):
+    """
+    Find the SOFR, FX spot and forward points columns in one pass.
+
+    The SOFR column is the one named for the tenor, else the first
+    mentioning SOFR (as find_sofr_column); for FX and forward points the
+    last matching column wins.
+
+    Returns:
+        tuple: (sofr_col, fx_col, fwd_pts_col), each None if not found
+    """
+    from calculate_swap_implied_rates import _sofr_column_tenor
+
+    sofr_col = sofr_fallback = fx_col = fwd_pts_col = None
+    for col in columns:
+        name = str(col)
+        if sofr_col is None:
+            if _sofr_column_tenor(name) == tenor:
+                sofr_col = col
+            elif sofr_fallback is None and 'SOFR' in name.upper():
+                sofr_fallback = col
+        if _FX_COLUMN_RE.search(name):
+            fx_col = col
+        if _FWD_COLUMN_RE.search(name):
+            fwd_pts_col = col
+    if sofr_col is None:
+        sofr_col = sofr_fallback
+    return sofr_col, fx_col, fwd_pts_col
+
+
+# get_holiday_calendar caches per year, but concurrent first calls from the
+# tenor threads would each build the same calendar; the lock also keeps the
+# calendar/calculator start-up prints from interleaving
+_CALENDAR_LOCK = threading.Lock()
+
+
+def _read_existing_output(output_file):
+    """
+    Previous output_master file as a DataFrame with 'YYYY-MM-DD' Date
+    strings, or None if there is none (or it cannot be read). The Parquet
+    copy is preferred when it is at least as new as the xlsx.
+    """
+    import pandas as pd
+    from calculate_swap_implied_rates import read_excel_input
+
+    parquet_file = output_file.with_suffix('.parquet')
+    try:
+        if (HAVE_PYARROW and parquet_file.exists()
+                and parquet_file.stat().st_mtime >= output_file.stat().st_mtime):
+            existing = pd.read_parquet(parquet_file)
+        else:
+            existing = read_excel_input(output_file)
+        existing['Date'] = pd.to_datetime(existing['Date']).dt.strftime('%Y-%m-%d')
+        return existing[['Date', 'Implied_SGD_Rate_Pct']]
+    except Exception:
+        # Any unreadable file (corrupt or truncated workbook: CalamineError,
+        # zipfile.BadZipFile; bad Parquet; missing columns) just means a
+        # full recalculation, which overwrites it
+        return None
+
+
+def _calculate_tenor(tenor, input_path, output_path, incremental=True):
+    """
+    Calculate implied SGD rates for one tenor's master file
+
+    With incremental=True, dates that already have an implied rate in the
+    existing output file are not recalculated; only new (or previously
+    failed) rows are, and the output is rewritten with them merged in,
+    in the master file's row order.
+
+    Returns:
+        list: progress messages, printed by the caller
+    """
+    import numpy as np
+    import pandas as pd
+    from calculate_swap_implied_rates import (
+        get_holiday_calendar, SwapImpliedRateCalculator, read_excel_input, EXCEL_WRITER_ENGINE
+    )
+
+    input_file = input_path / f'input_master_{tenor.lower()}.xlsx'
+    output_file = output_path / f'output_master_{tenor.lower()}.xlsx'
+
+    if not input_file.exists():
+        return [f"Skipping {tenor}: {input_file} not found"]
+
+    messages = [
+        f"\nProcessing {tenor} tenor...",
+        f"  Input:  {input_file}",
+        f"  Output: {output_file}",
+    ]
+
+    # calamine when installed, else openpyxl (see read_excel_input)
+    df = read_excel_input(input_file)
+    if df.empty:
+        messages.append(f"  No data in {input_file}")
+        return messages
+
+    # Find SOFR, FX and forward points columns
+    sofr_col, fx_col, fwd_pts_col = find_master_columns(df.columns, tenor)
+    if sofr_col is None:
+        messages.append(f"  Could not find SOFR column for {tenor}. Columns: {df.columns.tolist()}")
+        return messages
+    if fx_col is None or fwd_pts_col is None:
+        messages.append(f"  Could not find FX or ForwardPoints column. Columns: {df.columns.tolist()}")
+        return messages
+
+    # Parse the trade dates once; the calendar year, the calculation
+    # and the output Date column all work off this
+    trade_dates = pd.DatetimeIndex(pd.to_datetime(df['Date']))
+
+    # Initialize calendar and calculator
+    first_year = trade_dates[0].year
+    with _CALENDAR_LOCK:
+        calendar = get_holiday_calendar(year=first_year)
+        calculator = SwapImpliedRateCalculator(calendar, tenor=tenor)
+
+    # Only rows without an implied rate in the previous output are calculated
+    dates = trade_dates.strftime('%Y-%m-%d')
+    existing = _read_existing_output(output_file) if incremental and output_file.exists() else None
+    if existing is not None:
+        done = existing.loc[existing['Implied_SGD_Rate_Pct'].notna(), 'Date']
+        todo = ~dates.isin(done)
+        if not todo.any():
+            messages.append(f"  Up to date ({len(existing)} rows in {output_file})")
+            return messages
+        messages.append(f"  {int(todo.sum())} new rows ({len(df) - int(todo.sum())} already calculated)")
+        df, trade_dates = df[todo], trade_dates[todo]
+
+    # Calculate implied rates for all remaining rows in one vectorized pass
+    try:
+        results = calculator.process_batch(
+            trade_dates.to_numpy(dtype='datetime64[D]'),
+            df[sofr_col].to_numpy(dtype=np.float64),
+            df[fx_col].to_numpy(dtype=np.float64),
+            df[fwd_pts_col].to_numpy(dtype=np.float64)
+        )
+    except Exception as e:
+        messages.append(f"  Error processing {tenor}: {e}")
+        return messages
+    implied_rates = results['Implied_SGD_Rate_Pct']
+
+    # Merge the new rates into the previous ones, in master file row order
+    if existing is not None:
+        previous = existing.drop_duplicates('Date', keep='last').set_index('Date')
+        merged = previous['Implied_SGD_Rate_Pct'].reindex(dates).to_numpy(dtype=np.float64, copy=True)
+        merged[todo] = implied_rates
+        implied_rates = merged
+
+    # Write output
+    output_df = pd.DataFrame({
+        'Date': dates,
+        'Implied_SGD_Rate_Pct': implied_rates
+    })
+    output_df.to_excel(output_file, index=False, engine=EXCEL_WRITER_ENGINE)
+    messages.append(f"  Wrote {len(output_df)} rows to {output_file}")
+    if HAVE_PYARROW:
+        parquet_file = output_file.with_suffix('.parquet')
+        output_df.to_parquet(parquet_file, index=False, compression='zstd')
+        messages.append(f"  Wrote {parquet_file}")
+    return messages
+
+
+def calculate_implied_rates(input_dir=None, output_dir=None, incremental=True):
     """
     Calculate swap implied SGD rates for all tenors from master files.
 
     For each tenor (1M, 3M, 6M):
       - Reads input_master_{tenor}.xlsx
-      - Calculates implied SGD rate for every row
+      - Calculates implied SGD rate for every row not already in the output
       - Outputs output_master_{tenor}.xlsx with Date and Implied_SGD_Rate_Pct
 
     Args:
         input_dir: path to directory containing input_master_*.xlsx files
         output_dir: path to directory for output files (defaults to project root)
+        incremental: reuse rates already in the output files; False
+                     recalculates every row
     """
     if input_dir is None:
-        input_dir = str(Path(__file__).parent.parent / 'swap_implied_input')
+        input_dir = DEFAULT_INPUT_DIR
     if output_dir is None:
-        output_dir = str(Path(__file__).parent.parent)
+        output_dir = DEFAULT_OUTPUT_DIR
 
     print()
     print("=" * 70)
@@ -385,74 +794,16 @@ def calculate_implied_rates(input_dir=None, output_dir=None):
     input_path = Path(input_dir)
     output_path = Path(output_dir)
 
-    for tenor in ['1M', '3M', '6M']:
-        input_file = input_path / f'input_master_{tenor.lower()}.xlsx'
-        output_file = output_path / f'output_master_{tenor.lower()}.xlsx'
-
-        if not input_file.exists():
-            print(f"Skipping {tenor}: {input_file} not found")
-            continue
-
-        print(f"\nProcessing {tenor} tenor...")
-        print(f"  Input:  {input_file}")
-        print(f"  Output: {output_file}")
-
-        df = pd.read_excel(input_file)
-        if df.empty:
-            print(f"  No data in {input_file}")
-            continue
-
-        # Find SOFR column
-        sofr_col = find_sofr_column(df, tenor)
-        if sofr_col is None:
-            print(f"  Could not find SOFR column for {tenor}. Columns: {df.columns.tolist()}")
-            continue
-
-        # Find FX and forward points columns
-        fx_col = None
-        fwd_pts_col = None
-        for col in df.columns:
-            col_upper = col.upper()
-            if 'USDSGD' in col_upper or 'FX' in col_upper:
-                fx_col = col
-            if 'FORWARD' in col_upper or 'FORWARDPOINTS' in col_upper.replace(' ', ''):
-                fwd_pts_col = col
-        if fx_col is None or fwd_pts_col is None:
-            print(f"  Could not find FX or ForwardPoints column. Columns: {df.columns.tolist()}")
-            continue
-
-        # Initialize calendar and calculator
-        first_year = pd.to_datetime(df['Date'].iloc[0]).year
-        calendar = HolidayCalendar(year=first_year)
-        calculator = SwapImpliedRateCalculator(calendar, tenor=tenor)
-
-        # Calculate implied rate for each row
-        dates = []
-        implied_rates = []
-        for _, row in df.iterrows():
-            trade_date = pd.to_datetime(row['Date'])
-            try:
-                result = calculator.process_row(
-                    trade_date=trade_date,
-                    sofr_rate=row[sofr_col],
-                    spot_rate=row[fx_col],
-                    forward_points=row[fwd_pts_col],
-                    verbose=False
-                )
-                dates.append(trade_date.strftime('%Y-%m-%d'))
-                implied_rates.append(result['Implied_SGD_Rate_Pct'])
-            except Exception as e:
-                print(f"  Error processing {trade_date}: {e}")
-                dates.append(trade_date.strftime('%Y-%m-%d'))
-                implied_rates.append(None)
-
-        # Write output
-        output_df = pd.DataFrame({
-            'Date': dates,
-            'Implied_SGD_Rate_Pct': implied_rates
-        })
-        output_df.to_excel(output_file, index=False)
-        print(f"  Wrote {len(output_df)} rows to {output_file}")
+    # The three tenors are independent: read/calculate/write them in
+    # parallel and print each tenor's messages in order afterwards
+    tenors = ['1M', '3M', '6M']
+    with ThreadPoolExecutor(max_workers=len(tenors)) as executor:
+        outcomes = list(executor.map(
+            lambda tenor: _calculate_tenor(tenor, input_path, output_path, incremental),
+            tenors
+        ))
+    for messages in outcomes:
+        print("\n".join(messages))
 
     print()
     print("=" * 70)
@@ -506,6 +857,16 @@ Examples:
         default=None,
         help='Directory for output files (default: project root)'
     )
+    parser.add_argument(
+        '--recalc-all',
+        action='store_true',
+        help='Recalculate every row of the output files instead of only dates not yet calculated'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Re-extract SOFR, FX and Browse.AI forward points instead of reusing today's cached values"
+    )
     parser.add_argument(
         '--max-wait',
         type=int,
@@ -514,13 +875,27 @@ Examples:
     )
     parser.add_argument(
         '--poll-interval',
-        type=int,
+        type=float,
         default=5,
-        help='Seconds between Browse.AI status checks (default: 5)'
+        help='Maximum seconds between Browse.AI status checks (default: 5)'
+    )
+    parser.add_argument(
+        '--initial-poll-interval',
+        type=float,
+        default=0.5,
+        help='Seconds before the second Browse.AI status check (default: 0.5)'
+    )
+    parser.add_argument(
+        '--poll-growth',
+        type=float,
+        default=1.5,
+        help='Factor the delay between Browse.AI status checks grows by (default: 1.5)'
     )
 
     args = parser.parse_args()
 
+    cache = None if args.no_cache else ExtractionCache()
+
     # --browse-ai auto-enables --update-master and --calc-implied
     if args.browse_ai:
         args.update_master = True
@@ -531,7 +906,10 @@ Examples:
         forward_points = extract_with_browse_ai(
             credentials_path=args.credentials,
             max_wait=args.max_wait,
-            poll_interval=args.poll_interval
+            poll_interval=args.poll_interval,
+            initial_interval=args.initial_poll_interval,
+            poll_growth=args.poll_growth,
+            cache=cache
         )
 
         if not forward_points:
@@ -540,7 +918,7 @@ Examples:
 
         # Update master files
         sofr_rates, fx_rate, update_results = update_master_files(
-            forward_points, input_dir=args.input_dir
+            forward_points, input_dir=args.input_dir, cache=cache
         )
 
         if update_results is None:
@@ -548,22 +926,24 @@ Examples:
             return 1
 
         # Calculate implied rates
-        calculate_implied_rates(input_dir=args.input_dir, output_dir=args.output_dir)
+        calculate_implied_rates(input_dir=args.input_dir, output_dir=args.output_dir,
+                                incremental=not args.recalc_all)
 
         return 0
 
     elif args.selenium:
         # Selenium mode - use DataExtractor from update_swap_implied_data
-        extractor = DataExtractor(use_selenium=True)
+        extractor = get_extractor(use_selenium=True)
         fp = extractor.extract_forward_points()
 
         if fp:
             print(f"\nExtracted forward points (mid): 1M={fp['1M']}, 3M={fp['3M']}, 6M={fp['6M']}")
 
             if args.update_master:
-                update_master_files(fp, input_dir=args.input_dir)
+                update_master_files(fp, input_dir=args.input_dir, cache=cache)
             if args.calc_implied:
-                calculate_implied_rates(input_dir=args.input_dir, output_dir=args.output_dir)
+                calculate_implied_rates(input_dir=args.input_dir, output_dir=args.output_dir,
+                                        incremental=not args.recalc_all)
             return 0
         else:
             print("\nFailed to extract forward points")
@@ -600,9 +980,10 @@ Examples:
 
                     if len(fp) == 3:
                         if args.update_master:
-                            update_master_files(fp, input_dir=args.input_dir)
+                            update_master_files(fp, input_dir=args.input_dir, cache=cache)
                         if args.calc_implied:
-                            calculate_implied_rates(input_dir=args.input_dir, output_dir=args.output_dir)
+                            calculate_implied_rates(input_dir=args.input_dir, output_dir=args.output_dir,
+                                                    incremental=not args.recalc_all)
                     else:
                         print("Could not compute mid points from extracted data")
 
@@ -7,9 +7,11 @@ Extracts 1-month, 3-month, and 6-month forward points and saves to Excel.
 Usage:
     python extract_forward_points_selenium.py              # Uses requests (faster)
     python extract_forward_points_selenium.py --selenium   # Uses Selenium (more reliable)
+    python extract_forward_points_selenium.py --selenium --attach   # Reuse a running Chrome
 
 Requirements:
-    pip install requests beautifulsoup4 openpyxl selenium
+    pip install requests beautifulsoup4 lxml openpyxl selenium
+    pip install selectolax   # optional, faster table parsing
     
     For Selenium mode, also install:
     - Chrome browser
@@ -19,14 +21,28 @@ Requirements:
 import argparse
 from datetime import datetime
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+import os
+import re
 import sys
-import time
+
+# C-based lxml parser is much faster than html.parser; fall back if absent
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional: selectolax's Lexbor parser is much lighter than a BeautifulSoup tree
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 def extract_with_requests():
-    """Extract using requests + BeautifulSoup (faster, may be blocked)"""
+    """Extract using requests + an HTML parser (faster, may be blocked)"""
     import requests
-    from bs4 import BeautifulSoup
     
     url = "https://www.investing.com/currencies/usd-sgd-forward-rates"
     
@@ -34,7 +50,9 @@ def extract_with_requests():
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
+        # Only advertise br/zstd when a decoder is installed; otherwise the
+        # server could send a body requests can't decompress
+        'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1'
     }
@@ -44,123 +62,269 @@ def extract_with_requests():
         response = requests.get(url, headers=headers, timeout=15)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return parse_table(soup)
+        # Decode once as UTF-8 (what the page declares) so the parser
+        # skips its own charset sniffing
+        response.encoding = 'utf-8'
+        return parse_table(response.text)
         
     except Exception as e:
         print(f"Error with requests method: {e}")
         return None
 
-def extract_with_selenium():
-    """Extract using Selenium (more reliable, slower)"""
+# Forward pairs we extract, e.g. "USDSGD 3M FWD" -> '3'
+_FORWARD_PAIR_RE = re.compile(r'USDSGD ([136])M FWD')
+_PERIOD_NAMES = {'1': '1-Month', '3': '3-Month', '6': '6-Month'}
+
+# Quote columns stored as numbers, shown with four decimals in Excel
+NUMERIC_COLUMNS = ('Bid', 'Ask', 'High', 'Low', 'Change')
+NUMBER_FORMAT = '0.0000'
+
+# Workbook styles, built once and shared by every cell that uses them
+TITLE_FONT = Font(size=14, bold=True)
+SUBTITLE_FONT = Font(size=10, italic=True, color='666666')
+NOTE_FONT = Font(size=9, italic=True, color='666666')
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=11)
+PERIOD_FONT = Font(bold=True, size=10)
+HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+ALT_FILL = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+TITLE_ALIGN = Alignment(horizontal='center')
+CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+_WHITE_SIDE = Side(style='thin', color='FFFFFF')
+_GREY_SIDE = Side(style='thin', color='CCCCCC')
+HEADER_BORDER = Border(left=_WHITE_SIDE, right=_WHITE_SIDE, top=_WHITE_SIDE, bottom=_WHITE_SIDE)
+DATA_BORDER = Border(left=_GREY_SIDE, right=_GREY_SIDE, top=_GREY_SIDE, bottom=_GREY_SIDE)
+
+# Default DevTools address of a long-running Chrome for --attach
+DEFAULT_DEBUGGER_ADDRESS = '127.0.0.1:9222'
+
+# ChromeDriver resolved by webdriver-manager on an earlier run
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHROMEDRIVER_PATH_FILE = os.path.join(SCRIPT_DIR, '.chromedriver_path')
+
+def _cached_chromedriver():
+    """Return the recorded ChromeDriver path if it is still executable, else None"""
+    try:
+        with open(CHROMEDRIVER_PATH_FILE) as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.access(path, os.X_OK) else None
+
+def _start_chrome(chrome_options):
+    """
+    Start ChromeDriver/Chrome. webdriver-manager (which checks for driver
+    updates over the network) is only consulted when no recorded driver
+    exists or the recorded one fails to start a session, typically after a
+    Chrome update changed the required driver version.
+    """
     from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+    
+    cached = _cached_chromedriver()
+    if cached:
+        try:
+            return webdriver.Chrome(service=Service(executable_path=cached), options=chrome_options)
+        except SessionNotCreatedException as e:
+            print(f"Recorded ChromeDriver failed to start ({e.msg}). Resolving again...")
+            try:
+                os.remove(CHROMEDRIVER_PATH_FILE)
+            except OSError:
+                pass
+    
+    # Try to use webdriver-manager for automatic ChromeDriver installation
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        print("webdriver-manager not found. Using system ChromeDriver.")
+        return webdriver.Chrome(options=chrome_options)
+    
+    path = ChromeDriverManager().install()
+    driver = webdriver.Chrome(service=Service(executable_path=path), options=chrome_options)
+    try:
+        with open(CHROMEDRIVER_PATH_FILE, 'w') as f:
+            f.write(path)
+    except OSError:
+        pass
+    return driver
+
+def extract_with_selenium(attach=None):
+    """
+    Extract using Selenium (more reliable, slower).
+
+    attach: DevTools address ('host:port') of an already running Chrome
+    started with --remote-debugging-port. When given, the page is loaded
+    in that browser instead of launching (and quitting) a new one, so the
+    browser startup cost is paid once across scheduled runs.
+    """
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
-    from bs4 import BeautifulSoup
-    
-    try:
-        # Try to use webdriver-manager for automatic ChromeDriver installation
-        try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.chrome.service import Service
-            use_manager = True
-        except ImportError:
-            use_manager = False
-            print("webdriver-manager not found. Using system ChromeDriver.")
-    except Exception:
-        use_manager = False
     
     url = "https://www.investing.com/currencies/usd-sgd-forward-rates"
     
     chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    if attach:
+        # Launch flags are fixed by whoever started the running browser
+        chrome_options.add_experimental_option('debuggerAddress', attach)
+    else:
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-default-apps')
+        
+        # Only the forwards table is scraped - skip images, stylesheets and fonts
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'permissions.default.stylesheet': 2,
+        })
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
     
     driver = None
     try:
-        print("Launching Chrome browser...")
-        if use_manager:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+        if attach:
+            print(f"Attaching to Chrome at {attach}...")
         else:
-            driver = webdriver.Chrome(options=chrome_options)
+            print("Launching Chrome browser...")
+        driver = _start_chrome(chrome_options)
         
         print(f"Loading {url}...")
         driver.get(url)
         
-        # Wait for table to load
+        # Wait for the forward rows themselves rather than the table shell,
+        # returning as soon as they render
         wait = WebDriverWait(driver, 15)
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-        
-        # Give extra time for dynamic content
-        time.sleep(2)
-        
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        wait.until(EC.presence_of_element_located((By.XPATH, "//td[contains(., 'USDSGD 1M FWD')]")))
         
-        return parse_table(soup)
+        return parse_table(driver.page_source)
         
     except Exception as e:
         print(f"Error with Selenium method: {e}")
         return None
     finally:
-        if driver:
+        if driver and attach:
+            # Leave the shared browser running; only stop our ChromeDriver
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                pass
+            driver.service.stop()
+        elif driver:
             driver.quit()
 
-def parse_table(soup):
-    """Parse the forward rates table from BeautifulSoup object"""
+def _lexbor_text(node):
+    return node.text(strip=True)
+
+def _bs4_text(tag):
+    return tag.get_text(strip=True)
+
+def _table_rows(content):
+    """
+    Return a lazy iterator over the <td> cells of each row of the page's
+    first table, plus a function reading a cell's stripped text; (None,
+    None) if the page has no table. Uses selectolax when installed, else
+    BeautifulSoup.
+    """
+    if LexborHTMLParser is not None:
+        table = LexborHTMLParser(content).css_first('table')
+        if table is None:
+            return None, None
+        return (row.css('td') for row in table.css('tr')), _lexbor_text
+
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Only the forwards table is read, so skip building the rest of the page
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=SoupStrainer('table'))
     table = soup.find('table')
-    if not table:
+    if table is None:
+        return None, None
+    return (row.find_all('td') for row in table.find_all('tr')), _bs4_text
+
+def _to_num(text):
+    """Parse a quote such as '-1,027.47' or '+0.09'; None when blank or N/A"""
+    if not text or text in ('-', 'N/A'):
+        return None
+    try:
+        return float(text.replace(',', '').replace('+', ''))
+    except ValueError:
+        # Unexpected text is kept as-is rather than dropping the row
+        return text
+
+def parse_table(content):
+    """Parse the forward rates table from the page HTML (str or bytes)"""
+    rows, text = _table_rows(content)
+    if rows is None:
         print("Error: Forward rates table not found in page")
         return None
     
-    # Target periods we want to extract
-    target_periods = {
-        'USDSGD 1M FWD': '1-Month',
-        'USDSGD 3M FWD': '3-Month',
-        'USDSGD 6M FWD': '6-Month'
-    }
-    
     results = []
-    rows = table.find_all('tr')
+    found = set()
     
-    for row in rows:
-        cells = row.find_all('td')
-        if len(cells) >= 7:
-            name_cell = cells[0].get_text(strip=True)
+    for cells in rows:
+        if len(cells) < 7:
+            continue
+        
+        # One regex scan of the name cell picks out the target tenors
+        match = _FORWARD_PAIR_RE.search(text(cells[0]))
+        if not match:
+            continue
+        display_name = _PERIOD_NAMES[match.group(1)]
+        
+        try:
+            bid = text(cells[1])
+            ask = text(cells[2])
+            high = text(cells[3])
+            low = text(cells[4])
+            change = text(cells[5])
+            time_str = text(cells[6])
             
-            for target_name, display_name in target_periods.items():
-                if target_name in name_cell:
-                    try:
-                        bid = cells[1].get_text(strip=True)
-                        ask = cells[2].get_text(strip=True)
-                        high = cells[3].get_text(strip=True)
-                        low = cells[4].get_text(strip=True)
-                        change = cells[5].get_text(strip=True)
-                        time_str = cells[6].get_text(strip=True)
-                        
-                        results.append({
-                            'Period': display_name,
-                            'Bid': bid,
-                            'Ask': ask,
-                            'High': high,
-                            'Low': low,
-                            'Change': change,
-                            'Time': time_str
-                        })
-                        print(f"✓ Found {display_name}: Bid={bid}, Ask={ask}")
-                    except Exception as e:
-                        print(f"Error parsing {display_name}: {e}")
+            results.append({
+                'Period': display_name,
+                'Bid': _to_num(bid),
+                'Ask': _to_num(ask),
+                'High': _to_num(high),
+                'Low': _to_num(low),
+                'Change': _to_num(change),
+                'Time': time_str
+            })
+            print(f"✓ Found {display_name}: Bid={bid}, Ask={ask}")
+        except Exception as e:
+            print(f"Error parsing {display_name}: {e}")
+            continue
+        
+        # Rows after the last target tenor are never needed
+        found.add(display_name)
+        if len(found) == len(_PERIOD_NAMES):
+            break
     
     if len(results) == 0:
         print("Warning: No matching forward rate entries found")
     
     return results
 
+def _styled_cell(sheet, value, font=None, fill=None, alignment=None, border=None,
+                 number_format=None):
+    """Build a write-only cell, assigning the shared style objects by reference"""
+    cell = WriteOnlyCell(sheet, value=value)
+    if number_format is not None:
+        cell.number_format = number_format
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if border is not None:
+        cell.border = border
+    return cell
+
 def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
     """Create formatted Excel file with forward points data"""
     
@@ -168,65 +332,15 @@ def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
         print("No data to save")
         return False
     
-    wb = Workbook()
-    sheet = wb.active
-    sheet.title = 'Forward Points'
-    
-    # Title
-    sheet['A1'] = 'USD/SGD Forward Points'
-    sheet['A1'].font = Font(size=14, bold=True)
-    sheet.merge_cells('A1:G1')
-    sheet['A1'].alignment = Alignment(horizontal='center')
-    
-    sheet['A2'] = f'Extracted: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
-    sheet['A2'].font = Font(size=10, italic=True, color='666666')
-    sheet.merge_cells('A2:G2')
-    sheet['A2'].alignment = Alignment(horizontal='center')
+    # Write-only mode streams rows straight to the file instead of keeping
+    # a cell object per coordinate
+    wb = Workbook(write_only=True)
+    sheet = wb.create_sheet('Forward Points')
     
-    # Headers
     headers = ['Period', 'Bid', 'Ask', 'High', 'Low', 'Change', 'Time']
     header_row = 4
     
-    for col_num, header in enumerate(headers, 1):
-        cell = sheet.cell(row=header_row, column=col_num)
-        cell.value = header
-        cell.font = Font(bold=True, color='FFFFFF', size=11)
-        cell.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        thin_border = Border(
-            left=Side(style='thin', color='FFFFFF'),
-            right=Side(style='thin', color='FFFFFF'),
-            top=Side(style='thin', color='FFFFFF'),
-            bottom=Side(style='thin', color='FFFFFF')
-        )
-        cell.border = thin_border
-    
-    # Data rows
-    for row_num, record in enumerate(data, header_row + 1):
-        for col_num, header in enumerate(headers, 1):
-            cell = sheet.cell(row=row_num, column=col_num)
-            cell.value = record[header]
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-            # Alternating row colors
-            if row_num % 2 == 0:
-                cell.fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
-            
-            # Border
-            thin_border = Border(
-                left=Side(style='thin', color='CCCCCC'),
-                right=Side(style='thin', color='CCCCCC'),
-                top=Side(style='thin', color='CCCCCC'),
-                bottom=Side(style='thin', color='CCCCCC')
-            )
-            cell.border = thin_border
-            
-            # Bold period names
-            if col_num == 1:
-                cell.font = Font(bold=True, size=10)
-    
-    # Column widths
+    # Column widths and frozen header must be set before any row is written
     column_widths = {
         'A': 15,
         'B': 12,
@@ -240,17 +354,40 @@ def create_excel(data, filename='usd_sgd_forward_points.xlsx'):
     for col, width in column_widths.items():
         sheet.column_dimensions[col].width = width
     
-    # Notes
-    note_row = header_row + len(data) + 2
-    sheet[f'A{note_row}'] = 'Note: Forward points are in pips. Negative values indicate forward discount.'
-    sheet[f'A{note_row}'].font = Font(size=9, italic=True, color='666666')
-    
-    sheet[f'A{note_row + 1}'] = 'Source: Investing.com (https://www.investing.com/currencies/usd-sgd-forward-rates)'
-    sheet[f'A{note_row + 1}'].font = Font(size=9, italic=True, color='666666')
-    
     # Freeze panes (freeze header row)
     sheet.freeze_panes = f'A{header_row + 1}'
     
+    # Title
+    sheet.append([_styled_cell(sheet, 'USD/SGD Forward Points', font=TITLE_FONT, alignment=TITLE_ALIGN)])
+    sheet.merged_cells.add('A1:G1')
+    
+    extracted = f'Extracted: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
+    sheet.append([_styled_cell(sheet, extracted, font=SUBTITLE_FONT, alignment=TITLE_ALIGN)])
+    sheet.merged_cells.add('A2:G2')
+    sheet.append([])
+    
+    # Headers
+    sheet.append([
+        _styled_cell(sheet, header, font=HEADER_FONT, fill=HEADER_FILL,
+                     alignment=CENTER_ALIGN, border=HEADER_BORDER)
+        for header in headers
+    ])
+    
+    # Data rows, alternating row colors and bold period names
+    for row_num, record in enumerate(data, header_row + 1):
+        fill = ALT_FILL if row_num % 2 == 0 else None
+        sheet.append([
+            _styled_cell(sheet, record[header], font=PERIOD_FONT if col_num == 1 else None,
+                         fill=fill, alignment=CENTER_ALIGN, border=DATA_BORDER,
+                         number_format=NUMBER_FORMAT if isinstance(record[header], float) else None)
+            for col_num, header in enumerate(headers, 1)
+        ])
+    
+    # Notes
+    sheet.append([])
+    sheet.append([_styled_cell(sheet, 'Note: Forward points are in pips. Negative values indicate forward discount.', font=NOTE_FONT)])
+    sheet.append([_styled_cell(sheet, 'Source: Investing.com (https://www.investing.com/currencies/usd-sgd-forward-rates)', font=NOTE_FONT)])
+    
     try:
         wb.save(filename)
         print(f"\n✓ Data successfully saved to {filename}")
@@ -269,6 +406,14 @@ def main():
         action='store_true',
         help='Use Selenium instead of requests (more reliable but slower)'
     )
+    parser.add_argument(
+        '--attach',
+        nargs='?',
+        const=DEFAULT_DEBUGGER_ADDRESS,
+        metavar='HOST:PORT',
+        help='Use an already running Chrome (started with --remote-debugging-port) '
+             f'for Selenium instead of launching one (default: {DEFAULT_DEBUGGER_ADDRESS})'
+    )
     parser.add_argument(
         '-o', '--output',
         default='usd_sgd_forward_points.xlsx',
@@ -284,7 +429,7 @@ def main():
     # Extract data
     if args.selenium:
         print("\nUsing Selenium method...")
-        data = extract_with_selenium()
+        data = extract_with_selenium(args.attach)
     else:
         print("\nUsing requests method...")
         data = extract_with_requests()
@@ -292,7 +437,7 @@ def main():
         # Fallback to Selenium if requests fails
         if data is None:
             print("\nRequests method failed. Trying Selenium...")
-            data = extract_with_selenium()
+            data = extract_with_selenium(args.attach)
     
     # Create Excel file
     if data and len(data) > 0:
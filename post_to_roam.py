@@ -8,6 +8,10 @@ creates a block on the corresponding Roam Research daily note page.
 Usage:
     python post_to_roam.py
 
+Requirements:
+    pip install pandas openpyxl requests
+    pip install python-calamine   # optional, faster Excel reading
+
 Credentials:
     Reads ROAM_API_TOKEN and ROAM_GRAPH_NAME from the 'Roam_Research'
     file in the project root (one key=value per line), or from
@@ -19,39 +23,135 @@ import sys
 import json
 import requests
 import pandas as pd
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CREDS_FILE = os.path.join(SCRIPT_DIR, "Roam_Research")
 ROAM_API_BASE = "https://api.roamresearch.com"
 
+# One keep-alive connection shared by every Roam API call, so the page
+# lookup and the write reuse the same TLS session
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+# Datalog query for a page's UID by title (title passed as the ?title arg)
+_PAGE_UID_QUERY = '[:find ?uid :in $ ?title :where [?e :node/title ?title] [?e :block/uid ?uid]]'
+
 TENORS = ["1m", "3m", "6m"]
 
+# Latest (date, rate) per workbook, keyed by path and valid while the
+# file's mtime and size are unchanged
+RATES_CACHE_FILE = os.path.join(SCRIPT_DIR, ".latest_rates_cache.json")
+
+# Roam titles always use English month names, independent of the locale
+_MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December")
+# Ordinal suffix by last digit of the day (11th-13th handled separately)
+_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
+
+@lru_cache(maxsize=1)
+def _read_creds_file(path):
+    """Parse a key=value credentials file (read once per process)."""
+    with open(path, "r") as f:
+        return {
+            key.strip(): value.strip().strip("'\"")
+            for key, _, value in (line.strip().partition("=") for line in f)
+            if key and not key.startswith("#")
+        }
 
-def load_credentials():
-    """Load Roam Research credentials from file or environment."""
+
+def read_credentials():
+    """Read Roam Research credentials from environment or file.
+
+    Raises ValueError if the token or graph name is missing.
+    """
     token = os.environ.get("ROAM_API_TOKEN")
     graph = os.environ.get("ROAM_GRAPH_NAME")
 
     if not (token and graph) and os.path.exists(CREDS_FILE):
-        with open(CREDS_FILE, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                key, _, value = line.partition("=")
-                key, value = key.strip(), value.strip().strip("'\"")
-                if key == "ROAM_API_TOKEN":
-                    token = value
-                elif key == "ROAM_GRAPH_NAME":
-                    graph = value
+        creds = _read_creds_file(CREDS_FILE)
+        token = creds.get("ROAM_API_TOKEN", token)
+        graph = creds.get("ROAM_GRAPH_NAME", graph)
 
     if not token or not graph:
+        raise ValueError(
+            f"Set ROAM_API_TOKEN and ROAM_GRAPH_NAME in '{CREDS_FILE}' or as environment variables."
+        )
+
+    return token, graph
+
+
+def load_credentials():
+    """Load Roam Research credentials from file or environment."""
+    try:
+        return read_credentials()
+    except ValueError as e:
         print("Error: Missing credentials.")
-        print(f"Set ROAM_API_TOKEN and ROAM_GRAPH_NAME in '{CREDS_FILE}' or as environment variables.")
+        print(e)
         sys.exit(1)
 
-    return token, graph
+
+def _wanted_column(col):
+    return col in ("Trade_Date", "Date", "Implied_SGD_Rate_Pct")
+
+
+def _load_rates_cache():
+    """Load the latest-rates cache, or an empty dict if missing or corrupt."""
+    try:
+        with open(RATES_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_rates_cache(cache):
+    """Write the latest-rates cache atomically; failures are not fatal."""
+    tmp_path = f"{RATES_CACHE_FILE}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, RATES_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: could not write {RATES_CACHE_FILE}: {e}")
+
+
+def _load_tenor(tenor, cache):
+    """Read the latest (date, rate) from one output_master file.
+
+    Returns None if the file does not exist. An unchanged file (same
+    mtime and size as recorded in cache) is answered from cache without
+    opening it; otherwise cache is updated with the fresh values.
+    """
+    filepath = os.path.join(SCRIPT_DIR, f"output_master_{tenor}.xlsx")
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+
+    signature = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(filepath)
+    if entry and entry.get("signature") == signature:
+        return date.fromisoformat(entry["date"]), entry["rate"]
+
+    # Only the date and rate columns are needed; prefer the Rust-backed
+    # calamine reader, falling back to openpyxl when it isn't installed
+    try:
+        df = pd.read_excel(filepath, engine="calamine", usecols=_wanted_column)
+    except (ImportError, ValueError):
+        df = pd.read_excel(filepath, usecols=_wanted_column)
+    date_col = "Trade_Date" if "Trade_Date" in df.columns else "Date"
+    df[date_col] = pd.to_datetime(df[date_col])
+    row = df.loc[df[date_col].idxmax()]
+
+    row_date = row[date_col].date()
+    rate = float(row["Implied_SGD_Rate_Pct"])
+    cache[filepath] = {"signature": signature, "date": row_date.isoformat(), "rate": rate}
+    return row_date, rate
 
 
 def get_latest_rates():
@@ -62,20 +162,23 @@ def get_latest_rates():
     """
     rates = {}
     latest_date = None
+    cache = _load_rates_cache()
+    cached = dict(cache)
 
-    for tenor in TENORS:
-        filepath = os.path.join(SCRIPT_DIR, f"output_master_{tenor}.xlsx")
-        if not os.path.exists(filepath):
+    # The three workbooks are independent, so read them concurrently
+    with ThreadPoolExecutor(max_workers=len(TENORS)) as ex:
+        loaded = list(ex.map(lambda tenor: _load_tenor(tenor, cache), TENORS))
+
+    if cache != cached:
+        _save_rates_cache(cache)
+
+    for tenor, result in zip(TENORS, loaded):
+        if result is None:
+            filepath = os.path.join(SCRIPT_DIR, f"output_master_{tenor}.xlsx")
             print(f"Warning: {filepath} not found, skipping {tenor.upper()}")
             continue
 
-        df = pd.read_excel(filepath)
-        date_col = "Trade_Date" if "Trade_Date" in df.columns else "Date"
-        df[date_col] = pd.to_datetime(df[date_col])
-        row = df.loc[df[date_col].idxmax()]
-
-        row_date = row[date_col].date()
-        rate = row["Implied_SGD_Rate_Pct"]
+        row_date, rate = result
         rates[tenor] = rate
 
         if latest_date is None:
@@ -98,11 +201,8 @@ def date_to_roam_title(d):
     Example: date(2026, 2, 7) -> 'February 7th, 2026'
     """
     day = d.day
-    if 11 <= day <= 13:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
-    return f"{d.strftime('%B')} {day}{suffix}, {d.year}"
+    suffix = "th" if 11 <= day <= 13 else _SUFFIXES[day % 10]
+    return f"{_MONTHS[d.month - 1]} {day}{suffix}, {d.year}"
 
 
 def date_to_roam_uid(d):
@@ -113,7 +213,7 @@ def date_to_roam_uid(d):
     return d.strftime("%m-%d-%Y")
 
 
-def roam_write(token, graph, actions):
+def roam_write(token, graph, actions, session=None):
     """Execute write actions against the Roam Research API."""
     url = f"{ROAM_API_BASE}/api/graph/{graph}/write"
     headers = {
@@ -121,12 +221,12 @@ def roam_write(token, graph, actions):
         "Content-Type": "application/json",
     }
     payload = {"action": "batch-actions", "actions": actions}
-    resp = requests.post(url, headers=headers, json=payload, timeout=30)
+    resp = (session or _SESSION).post(url, headers=headers, json=payload, timeout=30)
     resp.raise_for_status()
     return resp.json() if resp.text else None
 
 
-def roam_query(token, graph, query, args=None):
+def roam_query(token, graph, query, args=None, session=None):
     """Execute a Datalog query against the Roam Research API."""
     url = f"{ROAM_API_BASE}/api/graph/{graph}/q"
     headers = {
@@ -136,15 +236,14 @@ def roam_query(token, graph, query, args=None):
     payload = {"query": query}
     if args:
         payload["args"] = args
-    resp = requests.post(url, headers=headers, json=payload, timeout=30)
+    resp = (session or _SESSION).post(url, headers=headers, json=payload, timeout=30)
     resp.raise_for_status()
     return resp.json()
 
 
-def get_page_uid(token, graph, page_title):
+def get_page_uid(token, graph, page_title, session=None):
     """Query for the UID of a page by title. Returns None if not found."""
-    query = '[:find ?uid :in $ ?title :where [?e :node/title ?title] [?e :block/uid ?uid]]'
-    response = roam_query(token, graph, query, args=[page_title])
+    response = roam_query(token, graph, _PAGE_UID_QUERY, args=[page_title], session=session)
     # Response format: {"result": [["uid-value"]]} or just [["uid-value"]]
     result = response.get("result", response) if isinstance(response, dict) else response
     if result and len(result) > 0:
@@ -153,54 +252,61 @@ def get_page_uid(token, graph, page_title):
     return None
 
 
-def ensure_daily_note(token, graph, page_title, page_uid):
-    """Create the daily note page if it doesn't already exist.
+def rates_block_action(page_uid, rates):
+    """Build the create-block action posting the rates under page_uid."""
+    parts = ["Swap-Implied SGD Rates -"]
+    for tenor in TENORS:
+        if tenor in rates:
+            parts.append(f"{tenor.upper()}: {rates[tenor]:.4f}%")
+
+    block_string = " | ".join(parts)
 
-    Returns the actual UID of the page (which may differ from page_uid
-    if the page was previously created with a different UID).
+    return {
+        "action": "create-block",
+        "location": {"parent-uid": page_uid, "order": "last"},
+        "block": {"string": block_string},
+    }
+
+
+def post_rates_to_roam(token, graph, page_uid, rates, session=None):
+    """Post swap-implied rates as a block on the daily note page."""
+    roam_write(token, graph, [rates_block_action(page_uid, rates)], session=session)
+
+
+def post_rates_to_daily_note(token, graph, page_title, page_uid, rates, session=None):
+    """Post rates to the daily note, creating the page if it doesn't exist.
+
+    A missing page is created in the same batch-actions write as the
+    rates block, so a new daily note costs one write instead of two.
+    Returns the UID of the page the rates were posted to. session
+    overrides the module's shared requests session.
     """
-    # Check if page exists and get its actual UID
-    actual_uid = get_page_uid(token, graph, page_title)
+    actual_uid = get_page_uid(token, graph, page_title, session=session)
 
     if actual_uid:
         print(f"Daily note page already exists: {page_title} (uid: {actual_uid})")
+        post_rates_to_roam(token, graph, actual_uid, rates, session=session)
         return actual_uid
 
-    # Page doesn't exist — create it
-    actions = [{"action": "create-page", "page": {"title": page_title, "uid": page_uid}}]
+    actions = [
+        {"action": "create-page", "page": {"title": page_title, "uid": page_uid}},
+        rates_block_action(page_uid, rates),
+    ]
     try:
-        roam_write(token, graph, actions)
+        roam_write(token, graph, actions, session=session)
         print(f"Created daily note page: {page_title}")
         return page_uid
     except requests.HTTPError:
         # Page may have been created concurrently — query for its UID
-        actual_uid = get_page_uid(token, graph, page_title)
+        actual_uid = get_page_uid(token, graph, page_title, session=session)
         if actual_uid:
             print(f"Page already exists (created concurrently): {page_title} (uid: {actual_uid})")
-            return actual_uid
-        # If we still can't find it, fall back to the expected UID
-        print(f"Warning: create-page failed but page not found. Using expected uid: {page_uid}")
-        return page_uid
-
-
-def post_rates_to_roam(token, graph, page_uid, rates):
-    """Post swap-implied rates as a block on the daily note page."""
-    parts = ["Swap-Implied SGD Rates -"]
-    for tenor in TENORS:
-        if tenor in rates:
-            parts.append(f"{tenor.upper()}: {rates[tenor]:.4f}%")
-
-    block_string = " | ".join(parts)
-
-    actions = [
-        {
-            "action": "create-block",
-            "location": {"parent-uid": page_uid, "order": "last"},
-            "block": {"string": block_string},
-        }
-    ]
-
-    roam_write(token, graph, actions)
+        else:
+            # If we still can't find it, fall back to the expected UID
+            print(f"Warning: create-page failed but page not found. Using expected uid: {page_uid}")
+            actual_uid = page_uid
+        post_rates_to_roam(token, graph, actual_uid, rates, session=session)
+        return actual_uid
 
 
 def main():
@@ -216,8 +322,7 @@ def main():
         if tenor in rates:
             print(f"  {tenor.upper()}: {rates[tenor]:.4f}%")
 
-    actual_uid = ensure_daily_note(token, graph, page_title, page_uid)
-    post_rates_to_roam(token, graph, actual_uid, rates)
+    post_rates_to_daily_note(token, graph, page_title, page_uid, rates)
 
     print(f"\nSuccessfully posted rates to Roam daily note: {page_title}")
 
@@ -4,7 +4,8 @@ End-to-end pipeline for USD/SGD FX swap implied SGD interest rates.
 
 Steps:
     1. Extract SOFR rates & FX spot rate
-    2. Run Browse AI table bot to extract forward points (auto-parse bid/ask)
+    2. Run Browse AI table bot to extract forward points (auto-parse bid/ask);
+       the bot task is started first so it runs remotely during step 1
     3. User confirms parsed values (or enters manually if rejected/failed)
     4. Update master input files
     5. Calculate implied rates for each tenor
@@ -18,12 +19,23 @@ Usage:
     python run_pipeline.py --no-browse-ai --no-roam
     python run_pipeline.py --skip-calc             # Only update input files
     python run_pipeline.py --selenium              # Use Selenium for scraping
+    python run_pipeline.py --auto-accept           # Accept parsed values unattended
+    python run_pipeline.py --confirm-timeout 60    # Accept if no answer within 60s
+    python run_pipeline.py --json-summary-path run.json  # Also save the run summary
+
+The last line of output is "SUMMARY " followed by a one-line JSON record
+of the run (rates used, latest implied rates, Roam posting, exit code).
 """
 
 import argparse
+import io
+import json
 import subprocess
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add project root to path so we can import from sibling packages
@@ -38,36 +50,71 @@ from extract_all_rates.update_swap_implied_data import (
     DataUpdater,
     manual_forward_points_input,
 )
-from extract_fwd_points.browse_ai_extractor import (
-    BrowseAIClient,
-    load_credentials as load_browse_ai_credentials,
-    download_screenshot,
-    parse_forward_points_from_table,
-)
-from calc_swap_implied.calculate_swap_implied_rates import process_excel_file
-from post_to_roam import (
-    load_credentials as load_roam_credentials,
-    get_latest_rates,
-    date_to_roam_title,
-    date_to_roam_uid,
-    ensure_daily_note,
-    post_rates_to_roam,
-)
+# Browse AI, the calculator (pandas) and the Roam client are imported in
+# the steps that use them, so partial runs don't pay for their imports
 
 
 TENORS = ["1M", "3M", "6M"]
 INPUT_DIR = PROJECT_ROOT / "swap_implied_input"
 SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
+BROWSE_AI_CREDS_FILE = PROJECT_ROOT / "Browse_AI"
+
+# (tenor, input master file, output master file) for each tenor
+_TENOR_PATHS = tuple(
+    (tenor,
+     INPUT_DIR / f"input_master_{tenor.lower()}.xlsx",
+     PROJECT_ROOT / f"output_master_{tenor.lower()}.xlsx")
+    for tenor in TENORS
+)
+# post_to_roam keys its rates by lowercase tenor
+_ROAM_TENOR_KEYS = tuple(tenor.lower() for tenor in TENORS)
+
+
+def _banner(title):
+    """Print a step banner (blank line, rule, title, rule) in one write."""
+    sys.stdout.write(f"\n{'=' * 70}\n{title}\n{'=' * 70}\n")
+
+
+# Robot names by robot ID, shown for information only
+ROBOT_INFO_CACHE_FILE = PROJECT_ROOT / ".browse_ai_cache.json"
+ROBOT_INFO_TTL = 24 * 3600
+
+
+def _cached_robot_name(client):
+    """Return the robot's name, fetching it at most once per ROBOT_INFO_TTL."""
+    try:
+        with open(ROBOT_INFO_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+
+    entry = cache.get(client.robot_id)
+    if isinstance(entry, dict) and time.time() - entry.get("ts", 0) < ROBOT_INFO_TTL:
+        return entry.get("name")
+
+    robot_info = client.get_robot_info()
+    if not robot_info:
+        return None
+    name = robot_info.get("name", "Unknown")
+
+    # Write atomically; a failed write only costs a refetch next run
+    cache[client.robot_id] = {"name": name, "ts": time.time()}
+    tmp_path = f"{ROBOT_INFO_CACHE_FILE}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, ROBOT_INFO_CACHE_FILE)
+    except OSError as e:
+        print(f"  Warning: could not write {ROBOT_INFO_CACHE_FILE}: {e}")
+    return name
 
 
-def step_extract_sofr_and_fx(use_selenium=False):
+def step_extract_sofr_and_fx(extractor):
     """Step 1: Extract SOFR rates and FX spot rate."""
-    print()
-    print("=" * 70)
-    print("STEP 1: EXTRACT SOFR RATES & FX SPOT")
-    print("=" * 70)
+    _banner("STEP 1: EXTRACT SOFR RATES & FX SPOT")
 
-    extractor = DataExtractor(use_selenium=use_selenium)
     sofr_rates = extractor.extract_sofr_rates()
     fx_rate = extractor.extract_usdsgd_fx()
 
@@ -81,25 +128,46 @@ def step_extract_sofr_and_fx(use_selenium=False):
     return sofr_rates, fx_rate
 
 
-def step_browse_ai_table():
-    """Step 2: Run Browse AI table bot and parse forward points automatically."""
-    print()
-    print("=" * 70)
-    print("STEP 2: RUN BROWSE AI TABLE BOT")
-    print("=" * 70)
+def load_browse_ai_creds():
+    """Load the Browse AI credentials tuple, or None if the file is missing.
+
+    Returns (api_key, workspace_id, robot_id, screenshot_robot_id).
+    """
+    if not BROWSE_AI_CREDS_FILE.exists():
+        return None
+
+    from extract_fwd_points.browse_ai_extractor import (
+        load_credentials as load_browse_ai_credentials,
+    )
+
+    return load_browse_ai_credentials(str(BROWSE_AI_CREDS_FILE))
+
 
-    credentials_path = PROJECT_ROOT / "Browse_AI"
-    if not credentials_path.exists():
-        print(f"Browse AI credentials file not found: {credentials_path}")
+def submit_browse_ai_table(browse_creds=None, session=None):
+    """Step 2 (start): Trigger the Browse AI table bot without waiting for it.
+
+    The task runs on Browse AI's side while SOFR & FX are extracted
+    locally. browse_creds is the tuple from load_browse_ai_creds (loaded
+    here if not given). Returns (client, task_id), or None if there are
+    no credentials.
+    """
+    _banner("STEP 2: START BROWSE AI TABLE BOT")
+
+    if browse_creds is None:
+        browse_creds = load_browse_ai_creds()
+    if browse_creds is None:
+        print(f"Browse AI credentials file not found: {BROWSE_AI_CREDS_FILE}")
         return None
 
-    api_key, workspace_id, robot_id, _ = load_browse_ai_credentials(str(credentials_path))
-    client = BrowseAIClient(api_key, robot_id)
+    from extract_fwd_points.browse_ai_extractor import BrowseAIClient
+
+    api_key, workspace_id, robot_id, _ = browse_creds
+    client = BrowseAIClient(api_key, robot_id, session=session)
 
     # Fetch robot info
-    robot_info = client.get_robot_info()
-    if robot_info:
-        print(f"  Robot Name: {robot_info.get('name', 'Unknown')}")
+    robot_name = _cached_robot_name(client)
+    if robot_name:
+        print(f"  Robot Name: {robot_name}")
 
     # Run task with required input parameters
     task_result = client.run_task(input_parameters={
@@ -107,9 +175,31 @@ def step_browse_ai_table():
         "usd_sgd_forward_rates_limit": 12,
     })
     task_id = task_result.get("id")
+    print("  The task runs remotely while SOFR & FX are extracted.")
+
+    return client, task_id
+
+
+def collect_browse_ai_table(job):
+    """Step 2 (finish): Wait for the table bot task and parse forward points.
 
-    # Wait for completion (20 min timeout — table extraction can be slow)
-    task = client.wait_for_completion(task_id, max_wait=1200)
+    job is the (client, task_id) returned by submit_browse_ai_table, or
+    None if no task was started.
+    """
+    if job is None:
+        return None
+
+    _banner("STEP 2: COLLECT BROWSE AI TABLE RESULTS")
+
+    from extract_fwd_points.browse_ai_extractor import parse_forward_points_from_table
+
+    client, task_id = job
+
+    # Wait for completion (20 min timeout — table extraction can be slow);
+    # check again after 1s, backing off to every 15s for long runs
+    task = client.wait_for_completion(
+        task_id, poll_interval=1, max_poll_interval=15, max_wait=1200
+    )
 
     # Parse table data
     parsed = parse_forward_points_from_table(task)
@@ -117,51 +207,60 @@ def step_browse_ai_table():
         print("\nNo forward points found in table data.")
         return None
 
-    # Display parsed values
-    print()
-    print("  Parsed forward points from Browse AI table:")
-    print(f"  {'Tenor':<8} {'Bid':>10} {'Ask':>10} {'Mid':>10}")
-    print(f"  {'-'*8} {'-'*10} {'-'*10} {'-'*10}")
-    for tenor in ["1M", "3M", "6M"]:
+    # Display parsed values, built up and printed in one write
+    rows = [
+        "\n  Parsed forward points from Browse AI table:",
+        f"  {'Tenor':<8} {'Bid':>10} {'Ask':>10} {'Mid':>10}",
+        f"  {'-'*8} {'-'*10} {'-'*10} {'-'*10}",
+    ]
+    for tenor in TENORS:
         if tenor in parsed:
             d = parsed[tenor]
-            print(f"  {tenor:<8} {d['bid']:>10.2f} {d['ask']:>10.2f} {d['mid']:>10.2f}")
+            rows.append(f"  {tenor:<8} {d['bid']:>10.2f} {d['ask']:>10.2f} {d['mid']:>10.2f}")
+    print("\n".join(rows))
 
     return parsed
 
 
-def step_browse_ai_screenshot():
+def step_browse_ai_table(browse_creds=None, session=None):
+    """Step 2: Run Browse AI table bot and parse forward points automatically."""
+    return collect_browse_ai_table(submit_browse_ai_table(browse_creds, session))
+
+
+def step_browse_ai_screenshot(browse_creds=None, session=None):
     """Step 2: Run Browse AI screenshot robot and download screenshots."""
-    print()
-    print("=" * 70)
-    print("STEP 2: RUN BROWSE AI SCREENSHOT ROBOT")
-    print("=" * 70)
+    _banner("STEP 2: RUN BROWSE AI SCREENSHOT ROBOT")
 
-    credentials_path = PROJECT_ROOT / "Browse_AI"
-    if not credentials_path.exists():
-        print(f"Browse AI credentials file not found: {credentials_path}")
+    if browse_creds is None:
+        browse_creds = load_browse_ai_creds()
+    if browse_creds is None:
+        print(f"Browse AI credentials file not found: {BROWSE_AI_CREDS_FILE}")
         return False
 
-    api_key, workspace_id, robot_id, screenshot_robot_id = load_browse_ai_credentials(
-        str(credentials_path)
+    from extract_fwd_points.browse_ai_extractor import (
+        BrowseAIClient,
+        download_screenshots,
+        safe_filename,
     )
+
+    api_key, workspace_id, robot_id, screenshot_robot_id = browse_creds
     if not screenshot_robot_id:
         print("No screenshot_robot_id found in credentials.")
         return False
 
-    client = BrowseAIClient(api_key, screenshot_robot_id)
+    client = BrowseAIClient(api_key, screenshot_robot_id, session=session)
 
     # Fetch robot info
-    robot_info = client.get_robot_info()
-    if robot_info:
-        print(f"  Robot Name: {robot_info.get('name', 'Unknown')}")
+    robot_name = _cached_robot_name(client)
+    if robot_name:
+        print(f"  Robot Name: {robot_name}")
 
     # Run task
     task_result = client.run_task()
     task_id = task_result.get("id")
 
-    # Wait for completion
-    task = client.wait_for_completion(task_id)
+    # Wait for completion, checking again after 1s and backing off to 15s
+    task = client.wait_for_completion(task_id, poll_interval=1, max_poll_interval=15)
 
     # Download screenshots
     captured_screenshots = task.get("capturedScreenshots", {})
@@ -178,20 +277,22 @@ def step_browse_ai_screenshot():
         else:
             screenshots_list = captured_screenshots
 
+        jobs = []
         for screenshot in screenshots_list:
             name = screenshot.get("name", "screenshot")
             url = screenshot.get("src") or screenshot.get("url")
             if url:
-                safe_name = "".join(
-                    c if c.isalnum() or c in "._-" else "_" for c in name
-                )
-                filename = f"{timestamp}_{safe_name}.png"
-                output_path = SCREENSHOTS_DIR / filename
-                print(f"  Downloading: {name}")
-                try:
-                    download_screenshot(url, output_path)
-                except Exception as e:
-                    print(f"    Error: {e}")
+                filename = f"{timestamp}_{safe_filename(name)}.png"
+                jobs.append((url, SCREENSHOTS_DIR / filename, name))
+
+        # Downloads are independent: fetch them all concurrently
+        for _, _, name in jobs:
+            print(f"  Downloading: {name}")
+        for name, result in download_screenshots(jobs, session=session):
+            if isinstance(result, Exception):
+                print(f"    Error downloading {name}: {result}")
+            else:
+                print(f"    Saved: {result}")
 
         print(f"\nScreenshots saved to: {SCREENSHOTS_DIR}")
 
@@ -199,24 +300,68 @@ def step_browse_ai_screenshot():
         saved_files = list(SCREENSHOTS_DIR.glob(f"{timestamp}_*.png"))
         if saved_files:
             print("Opening screenshots in Preview...")
-            subprocess.run(["open"] + [str(f) for f in saved_files])
+            # Fire and forget: the pipeline goes on to prompt for values
+            subprocess.Popen(
+                ["open"] + [str(f) for f in saved_files],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+            )
     else:
         print("\nNo screenshots captured.")
 
     return True
 
 
+def _ask_accept(timeout=None):
+    """Ask whether to accept the parsed values; returns the lowercased answer.
+
+    With a timeout (seconds), no answer counts as accepting (""). The wait
+    uses select() on stdin, so on platforms where that isn't supported
+    (Windows) the prompt falls back to blocking.
+    """
+    prompt = "  Accept these values? [Y/n]: "
+    if timeout is None:
+        return input(prompt).strip().lower()
+
+    import select
+
+    print(prompt, end="", flush=True)
+    try:
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    except (OSError, ValueError):
+        return input().strip().lower()
+    if not ready:
+        print(f"\n  No answer after {timeout:g}s. Auto-accepting.")
+        return ""
+    return sys.stdin.readline().strip().lower()
+
+
 def step_forward_points(use_browse_ai=True, use_browse_ai_screenshot=False,
-                        use_selenium=False):
-    """Step 2+3: Get forward points (Browse AI table, screenshot, or scrape)."""
+                        extractor=None, table_job=None, browse_creds=None,
+                        session=None, auto_accept=False, confirm_timeout=None):
+    """Step 2+3: Get forward points (Browse AI table, screenshot, or scrape).
+
+    extractor is the DataExtractor shared with step 1, so scraping reuses
+    its browser and connections. table_job is the table bot task already
+    started by submit_browse_ai_table (None if it could not be started).
+    browse_creds is the Browse AI credentials tuple loaded once by
+    run_steps; session is the pipeline's shared HTTP session.
+    auto_accept skips the confirmation prompt for parsed table values;
+    confirm_timeout accepts them if the prompt gets no answer in time.
+    """
     if use_browse_ai and not use_browse_ai_screenshot:
         # Default: table bot with automatic parsing
-        parsed = step_browse_ai_table()
+        parsed = collect_browse_ai_table(table_job)
 
         if parsed:
             # Ask user for confirmation
             print()
-            confirm = input("  Accept these values? [Y/n]: ").strip().lower()
+            if auto_accept:
+                print("  Auto-accepting parsed values (--auto-accept).")
+                confirm = ""
+            else:
+                confirm = _ask_accept(confirm_timeout)
             if confirm in ("", "y", "yes"):
                 # Use mid values as forward points
                 forward_points = {}
@@ -229,32 +374,24 @@ def step_forward_points(use_browse_ai=True, use_browse_ai_screenshot=False,
                 print("  Rejected. Falling back to manual input.")
 
         # Fall back to manual input
-        print()
-        print("=" * 70)
-        print("STEP 3: ENTER FORWARD POINTS MANUALLY")
-        print("=" * 70)
+        _banner("STEP 3: ENTER FORWARD POINTS MANUALLY")
         forward_points = manual_forward_points_input()
 
     elif use_browse_ai_screenshot:
         # Old screenshot flow
-        success = step_browse_ai_screenshot()
+        success = step_browse_ai_screenshot(browse_creds, session)
         if not success:
             print("\nBrowse AI screenshot failed. Falling back to manual input.")
 
         # Prompt user for bid/ask from screenshots
-        print()
-        print("=" * 70)
-        print("STEP 3: ENTER FORWARD POINTS FROM SCREENSHOTS")
-        print("=" * 70)
+        _banner("STEP 3: ENTER FORWARD POINTS FROM SCREENSHOTS")
         forward_points = manual_forward_points_input()
 
     else:
         # Scrape from investing.com
-        print()
-        print("=" * 70)
-        print("STEP 2-3: SCRAPE FORWARD POINTS")
-        print("=" * 70)
-        extractor = DataExtractor(use_selenium=use_selenium)
+        _banner("STEP 2-3: SCRAPE FORWARD POINTS")
+        if extractor is None:
+            extractor = DataExtractor()
         forward_points = extractor.extract_forward_points()
 
         if not forward_points:
@@ -264,21 +401,33 @@ def step_forward_points(use_browse_ai=True, use_browse_ai_screenshot=False,
     return forward_points
 
 
-def step_update_master_files(sofr_rates, fx_rate, forward_points):
-    """Step 4: Update master input files."""
-    print()
-    print("=" * 70)
-    print("STEP 4: UPDATE MASTER INPUT FILES")
-    print("=" * 70)
-
+def check_master_files():
+    """Return a DataUpdater for INPUT_DIR, or None if master files are missing."""
     updater = DataUpdater(input_dir=str(INPUT_DIR))
 
     if not updater.validate_files():
         print("\nMaster files not found. Run with --create-sample first:")
         print("  python extract_all_rates/update_swap_implied_data.py --create-sample")
-        return False
+        return None
+    return updater
 
-    results = updater.update_files(sofr_rates, fx_rate, forward_points)
+
+def step_update_master_files(sofr_rates, fx_rate, forward_points, on_updated=None,
+                             updater=None):
+    """Step 4: Update master input files.
+
+    on_updated(tenor, status) is called as soon as each file is written.
+    updater is the DataUpdater already checked by check_master_files;
+    without one the master files are checked here.
+    """
+    _banner("STEP 4: UPDATE MASTER INPUT FILES")
+
+    if updater is None:
+        updater = check_master_files()
+        if updater is None:
+            return False
+
+    results = updater.update_files(sofr_rates, fx_rate, forward_points, on_updated)
 
     success_count = sum(1 for r in results.values() if r == "success")
     skipped_count = sum(1 for r in results.values() if r == "skipped")
@@ -287,43 +436,110 @@ def step_update_master_files(sofr_rates, fx_rate, forward_points):
     return success_count > 0 or skipped_count > 0
 
 
-def step_calculate_implied_rates():
-    """Step 5: Calculate implied rates for each tenor."""
-    print()
-    print("=" * 70)
-    print("STEP 5: CALCULATE IMPLIED RATES")
-    print("=" * 70)
-
-    for tenor in TENORS:
-        input_file = INPUT_DIR / f"input_master_{tenor.lower()}.xlsx"
-        output_file = PROJECT_ROOT / f"output_master_{tenor.lower()}.xlsx"
+def _calculate_tenor(input_file, output_file, tenor):
+    """Worker for step_calculate_implied_rates: process one tenor's workbook.
 
-        if not input_file.exists():
-            print(f"\nSkipping {tenor}: {input_file} not found")
-            continue
+    Returns (report, error, latest): the calculator's printed report,
+    captured so the parent can print the tenors in order, the error
+    message if it failed (else None), and the latest trade's
+    {"date", "rate"} (else None).
+    """
+    import pandas as pd
+    from calc_swap_implied.calculate_swap_implied_rates import process_excel_file
 
-        print(f"\nProcessing {tenor}...")
+    report = io.StringIO()
+    with redirect_stdout(report):
         try:
-            process_excel_file(
-                str(input_file), str(output_file), tenor=tenor, verbose=False
-            )
-            print(f"  Output: {output_file}")
+            results = process_excel_file(input_file, output_file, tenor=tenor, verbose=False)
         except Exception as e:
-            print(f"  Error processing {tenor}: {e}")
+            return report.getvalue(), str(e), None
 
+    latest = None
+    if results is not None and len(results):
+        row = results.loc[pd.to_datetime(results["Trade_Date"]).idxmax()]
+        latest = {
+            "date": pd.Timestamp(row["Trade_Date"]).date().isoformat(),
+            "rate": float(row["Implied_SGD_Rate_Pct"]),
+        }
+    return report.getvalue(), None, latest
+
+
+def submit_calculation(executor, tenor, input_file, output_file):
+    """Start calculating one tenor's implied rates on a process pool."""
+    return executor.submit(_calculate_tenor, str(input_file), str(output_file), tenor)
+
+
+def step_calculate_implied_rates(futures=None):
+    """Step 5: Calculate implied rates for each tenor.
+
+    The tenors are independent and CPU-bound, so each workbook is
+    processed in its own worker process. futures maps a tenor to a
+    calculation already started by submit_calculation; the remaining
+    tenors are started here. Returns the latest {"date", "rate"} of each
+    tenor calculated successfully.
+    """
+    _banner("STEP 5: CALCULATE IMPLIED RATES")
+
+    futures = dict(futures or {})
+    implied = {}
+
+    # One directory listing instead of a stat per tenor
+    try:
+        with os.scandir(INPUT_DIR) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        existing = set()
+    pending = [job for job in _TENOR_PATHS
+               if job[0] not in futures and job[1].name in existing]
+
+    with ProcessPoolExecutor(max_workers=max(len(pending), 1)) as executor:
+        for tenor, input_file, output_file in pending:
+            futures[tenor] = submit_calculation(executor, tenor, input_file, output_file)
+
+        # Report in tenor order, as the serial loop did
+        for tenor, input_file, output_file in _TENOR_PATHS:
+            future = futures.get(tenor)
+            if future is None:
+                print(f"\nSkipping {tenor}: {input_file} not found")
+                continue
+
+            print(f"\nProcessing {tenor}...")
+            try:
+                report, error, latest = future.result()
+            except Exception as e:
+                print(f"  Error processing {tenor}: {e}")
+                continue
+            print(report, end="")
+            if error:
+                print(f"  Error processing {tenor}: {error}")
+            else:
+                print(f"  Output: {output_file}")
+                if latest:
+                    implied[tenor] = latest
+
+    return implied
 
-def step_post_to_roam():
-    """Step 6: Post latest rates to Roam Research."""
-    print()
-    print("=" * 70)
-    print("STEP 6: POST TO ROAM RESEARCH")
-    print("=" * 70)
+
+def step_post_to_roam(session=None):
+    """Step 6: Post latest rates to Roam Research.
+
+    Returns the title of the daily note posted to, or None if skipped.
+    """
+    _banner("STEP 6: POST TO ROAM RESEARCH")
+
+    from post_to_roam import (
+        read_credentials as read_roam_credentials,
+        get_latest_rates,
+        date_to_roam_title,
+        date_to_roam_uid,
+        post_rates_to_daily_note,
+    )
 
     try:
-        token, graph = load_roam_credentials()
-    except SystemExit:
+        token, graph = read_roam_credentials()
+    except ValueError:
         print("Roam credentials not found. Skipping.")
-        return
+        return None
 
     latest_date, rates = get_latest_rates()
 
@@ -332,14 +548,32 @@ def step_post_to_roam():
 
     print(f"Latest date: {latest_date}")
     print(f"Roam page: {page_title} (uid: {page_uid})")
-    for tenor in ["1m", "3m", "6m"]:
-        if tenor in rates:
-            print(f"  {tenor.upper()}: {rates[tenor]:.4f}%")
+    for tenor, key in zip(TENORS, _ROAM_TENOR_KEYS):
+        if key in rates:
+            print(f"  {tenor}: {rates[key]:.4f}%")
 
-    actual_uid = ensure_daily_note(token, graph, page_title, page_uid)
-    post_rates_to_roam(token, graph, actual_uid, rates)
+    post_rates_to_daily_note(token, graph, page_title, page_uid, rates, session=session)
 
     print(f"\nSuccessfully posted rates to Roam daily note: {page_title}")
+    return page_title
+
+
+def write_summary(summary, path=None):
+    """Print the run summary as one JSON line, and save it to path if given.
+
+    The file is written atomically, so readers never see a partial summary.
+    """
+    print("SUMMARY " + json.dumps(summary, separators=(",", ":"), default=str))
+    if not path:
+        return
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(summary, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not write summary to {path}: {e}")
 
 
 def main():
@@ -355,6 +589,9 @@ Examples:
   python run_pipeline.py --no-browse-ai --no-roam # Scrape, no Roam
   python run_pipeline.py --skip-calc              # Only update input files
   python run_pipeline.py --selenium               # Use Selenium for scraping
+  python run_pipeline.py --auto-accept            # Accept parsed values unattended
+  python run_pipeline.py --confirm-timeout 60     # Accept if no answer within 60s
+  python run_pipeline.py --json-summary-path run.json  # Also save the JSON summary
         """,
     )
     parser.add_argument(
@@ -382,6 +619,24 @@ Examples:
         action="store_true",
         help="Skip calculation step (only update input files)",
     )
+    parser.add_argument(
+        "--auto-accept",
+        action="store_true",
+        help="Accept the parsed Browse AI table values without prompting",
+    )
+    parser.add_argument(
+        "--confirm-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Accept the parsed values if the prompt gets no answer within SECONDS",
+    )
+    parser.add_argument(
+        "--json-summary-path",
+        default=None,
+        metavar="PATH",
+        help="Also write the JSON run summary to PATH",
+    )
 
     args = parser.parse_args()
 
@@ -399,41 +654,120 @@ Examples:
     print(f"  Calculate:  {'OFF' if args.skip_calc else 'ON'}")
     print(f"  Post Roam:  {'OFF' if args.no_roam else 'ON'}")
 
-    # Step 1: Extract SOFR & FX
-    sofr_rates, fx_rate = step_extract_sofr_and_fx(use_selenium=args.selenium)
-    if not sofr_rates or not fx_rate:
-        print("\nPipeline aborted: failed to extract SOFR rates or FX rate.")
+    # One keep-alive connection pool for every Browse AI, screenshot and
+    # Roam request in the run
+    session = None
+    if not (args.no_browse_ai and args.no_roam):
+        from extract_fwd_points.browse_ai_extractor import pooled_session
+        session = pooled_session()
+    summary = {}
+    exit_code = 1
+    try:
+        exit_code = run_steps(args, session, summary)
+    except SystemExit as e:
+        # e.g. post_to_roam.get_latest_rates exiting when no outputs exist
+        exit_code = e.code if isinstance(e.code, int) else 1
+        summary["error"] = f"SystemExit: {e.code}"
+        raise
+    except BaseException as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if session is not None:
+            session.close()
+        # Written even when a step raised, so the summary is always the
+        # last line of output
+        summary["exit_code"] = exit_code
+        write_summary(summary, args.json_summary_path)
+    return exit_code
+
+
+def run_steps(args, session=None, summary=None):
+    """Run steps 1-6 as selected by the command-line args; returns the exit code.
+
+    The rates used and the outcome of each step are recorded in summary.
+    """
+    if summary is None:
+        summary = {}
+    summary.update(
+        sofr=None, fx=None, forward_points=None, implied=None, posted_to_roam=None
+    )
+
+    # Step 4 needs the master files: check for them before spending time
+    # on extraction
+    updater = check_master_files()
+    if updater is None:
+        print("\nPipeline aborted: master input files are missing.")
         return 1
 
-    # Step 2+3: Forward points
+    # Step 2 (start): the table bot spends most of its time queued and
+    # running on Browse AI's side, so start it before the local extraction
     use_browse_ai = not args.no_browse_ai
-    forward_points = step_forward_points(
-        use_browse_ai=use_browse_ai,
-        use_browse_ai_screenshot=args.browse_ai_screenshot,
-        use_selenium=args.selenium,
-    )
+    browse_creds = load_browse_ai_creds() if use_browse_ai else None
+    table_job = None
+    if use_browse_ai and not args.browse_ai_screenshot:
+        table_job = submit_browse_ai_table(browse_creds, session)
+
+    # One extractor serves steps 1-3, so with --selenium the browser is
+    # started at most once; it is closed as soon as scraping is done
+    with DataExtractor(use_selenium=args.selenium) as extractor:
+        # Step 1: Extract SOFR & FX
+        sofr_rates, fx_rate = step_extract_sofr_and_fx(extractor)
+        summary["sofr"], summary["fx"] = sofr_rates, fx_rate
+        if not sofr_rates or not fx_rate:
+            print("\nPipeline aborted: failed to extract SOFR rates or FX rate.")
+            return 1
+
+        # Step 2+3: Forward points
+        forward_points = step_forward_points(
+            use_browse_ai=use_browse_ai,
+            use_browse_ai_screenshot=args.browse_ai_screenshot,
+            extractor=extractor,
+            table_job=table_job,
+            browse_creds=browse_creds,
+            session=session,
+            auto_accept=args.auto_accept,
+            confirm_timeout=args.confirm_timeout,
+        )
+    summary["forward_points"] = forward_points
     if not forward_points:
         print("\nPipeline aborted: failed to get forward points.")
         return 1
 
-    # Step 4: Update master files
-    ok = step_update_master_files(sofr_rates, fx_rate, forward_points)
-    if not ok:
-        print("\nPipeline aborted: failed to update master files.")
-        return 1
+    if args.skip_calc:
+        # Step 4: Update master files
+        ok = step_update_master_files(sofr_rates, fx_rate, forward_points, updater=updater)
+        if not ok:
+            print("\nPipeline aborted: failed to update master files.")
+            return 1
+    else:
+        # Step 4+5: each tenor's calculation starts as soon as its master
+        # file is written, overlapping the other tenors' updates
+        with ProcessPoolExecutor(max_workers=len(TENORS)) as executor:
+            futures = {}
+            paths = {tenor: (input_file, output_file)
+                     for tenor, input_file, output_file in _TENOR_PATHS}
+
+            def start_calculation(tenor, status):
+                if status != "failed":
+                    futures[tenor] = submit_calculation(executor, tenor, *paths[tenor])
+
+            ok = step_update_master_files(
+                sofr_rates, fx_rate, forward_points,
+                on_updated=start_calculation, updater=updater,
+            )
+            if not ok:
+                print("\nPipeline aborted: failed to update master files.")
+                return 1
 
-    # Step 5: Calculate implied rates
-    if not args.skip_calc:
-        step_calculate_implied_rates()
+            # Step 5: Calculate implied rates
+            summary["implied"] = step_calculate_implied_rates(futures)
 
     # Step 6: Post to Roam
     if not args.no_roam:
-        step_post_to_roam()
+        summary["posted_to_roam"] = step_post_to_roam(session)
 
-    print()
-    print("=" * 70)
-    print("PIPELINE COMPLETE")
-    print("=" * 70)
+    _banner("PIPELINE COMPLETE")
     return 0
 
 